@@ -0,0 +1,116 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "fractal-visualizer", "images")
+
+
+def save_cache_file(cached, stem, write):
+    """Write the cache file at path cached with write(f), then delete the other files named stem-*.
+
+    The file is written under a temporary name and renamed into place, so other
+    processes never read half of it, and older versions of the same entry are
+    only deleted once it is there.  A cache that can't be written (read-only
+    or full disk) is left as it was, which only costs a later start the work.
+    """
+    cache_dir, own = os.path.split(cached)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        partial = f"{cached}.{os.getpid()}.part"
+        with open(partial, "wb") as f:
+            write(f)
+        os.replace(partial, cached)
+        for name in os.listdir(cache_dir):
+            if name.startswith(stem + "-") and name != own and not name.endswith(".part"):
+                os.remove(os.path.join(cache_dir, name))
+    except OSError:
+        pass
+
+
+# --- Shared image cache ---
+class AssetManager:
+    """Decoded, display-converted and scaled images, shared by every scene and the gallery.
+
+    Surfaces stay in memory in least-recently-used order until their pixels
+    exceed budget_mb.  Scaled images are also written to cache_dir as raw
+    pixels, named after the source path, its mtime, the target size and the
+    pixel layout, so a restart at the same resolution skips both the PNG
+    decode and the scale.
+    Editing the source changes its mtime, which retires the old file.
+    """
+
+    def __init__(self, budget_mb=256, cache_dir=CACHE_DIR):
+        self.budget = budget_mb * 1024 * 1024
+        self.cache_dir = cache_dir
+        self.surfaces = OrderedDict()
+        self.used = 0
+        self.lock = threading.RLock()  # scenes are built on the preloader thread too
+
+    def image(self, path, size=None, alpha=False, smooth=False):
+        """path decoded and converted for the display (with alpha if asked), scaled to size if given.
+
+        Treat the result as read-only: it is shared with everyone who asks for the same image.
+        """
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        key = (path, mtime, size, alpha, smooth)
+        with self.lock:
+            surf = self.surfaces.get(key)
+            if surf is not None:
+                self.surfaces.move_to_end(key)
+                return surf
+
+        if size is None:
+            surf = pygame.image.load(path)
+            surf = surf.convert_alpha() if alpha else surf.convert()
+        else:
+            surf = self.load_scaled(path, mtime, size, alpha, smooth)
+        self.store(key, surf)
+        return surf
+
+    def load_scaled(self, path, mtime, size, alpha, smooth):
+        # Cached in the display's own pixel layout, so loading is one read straight into a Surface
+        surf = pygame.Surface(size, pygame.SRCALPHA if alpha else 0, 32 if alpha else pygame.display.get_surface())
+        stem, cached = self.cache_file(path, mtime, smooth, surf)
+        try:
+            with open(cached, "rb") as f:
+                if f.readinto(surf.get_view("0")) == surf.get_pitch() * size[1]:
+                    return surf
+        except OSError:
+            pass  # not cached yet
+
+        source = self.image(path, alpha=alpha)
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        surf = scale(source, size)
+        stem, cached = self.cache_file(path, mtime, smooth, surf)
+        save_cache_file(cached, stem, lambda f: f.write(surf.get_view("0")))
+        return surf
+
+    def cache_file(self, path, mtime, smooth, surf):
+        """(stem shared by every mtime of this source/size/layout, file for this mtime)"""
+        layout = (surf.get_size(), surf.get_bytesize(), surf.get_pitch(), surf.get_masks())
+        stem = hashlib.sha1(f"{path}|{smooth}|{layout}".encode()).hexdigest()
+        return stem, os.path.join(self.cache_dir, f"{stem}-{mtime}.raw")
+
+    def store(self, key, surf):
+        with self.lock:
+            if key in self.surfaces:
+                self.used -= self.size_of(self.surfaces.pop(key))
+            self.surfaces[key] = surf
+            self.used += self.size_of(surf)
+            while self.used > self.budget and len(self.surfaces) > 1:
+                _, old = self.surfaces.popitem(last=False)
+                self.used -= self.size_of(old)
+
+    def clear(self):
+        with self.lock:
+            self.surfaces.clear()
+            self.used = 0
+
+    @staticmethod
+    def size_of(surf):
+        w, h = surf.get_size()
+        return w * h * surf.get_bytesize()
@@ -0,0 +1,127 @@
+import hashlib
+import os
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pygame
+
+from assets import save_cache_file
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "fractal-visualizer", "audio")
+
+# Frequency bands (Hz) whose energy scenes can follow
+BANDS = ((20, 250), (250, 2000), (2000, 8000))
+WINDOW = 2048  # FFT size; a little over two 60 fps frames at 44.1 kHz
+CHUNK = 1024  # frames analyzed per batch, to bound memory on long tracks
+
+# One simulation step's worth of music, every level 0-1
+Sound = namedtuple("Sound", "bass mid high onset")
+QUIET = Sound(0.0, 0.0, 0.0, 0.0)
+
+
+def analyze(samples, rate, fps):
+    """(frames, 4) uint8 levels per 1/fps seconds of samples: energy per band, then onset strength.
+
+    Band energies are log-compressed, onsets are positive spectral flux, and
+    each column is scaled so the track's 5th to 98th percentiles span 0-255.
+    """
+    mono = samples.astype(np.float32).reshape(len(samples), -1).mean(axis=1)
+    hop = rate / fps
+    frames = int(len(mono) / hop)
+    mono = np.pad(mono, (WINDOW // 2, WINDOW))
+    window = np.hanning(WINDOW).astype(np.float32)
+    freqs = np.fft.rfftfreq(WINDOW, 1 / rate)
+    bands = [(freqs >= lo) & (freqs < hi) for lo, hi in BANDS]
+
+    levels = np.zeros((frames, len(BANDS) + 1), np.float32)
+    previous = None
+    for start in range(0, frames, CHUNK):
+        offsets = (np.arange(start, min(start + CHUNK, frames)) * hop).astype(np.int64)
+        spectrum = np.abs(np.fft.rfft(mono[offsets[:, None] + np.arange(WINDOW)] * window, axis=1))
+        for b, band in enumerate(bands):
+            levels[start:start + len(offsets), b] = np.log1p(np.square(spectrum[:, band]).sum(axis=1))
+        flux = np.diff(spectrum, axis=0, prepend=spectrum[:1] if previous is None else previous[None])
+        levels[start:start + len(offsets), -1] = np.maximum(flux, 0).sum(axis=1)
+        previous = spectrum[-1]
+
+    if not frames:
+        return levels.astype(np.uint8)
+    floor, peak = np.percentile(levels, (5, 98), axis=0)
+    return (np.clip((levels - floor) / np.maximum(peak - floor, 1e-6), 0, 1) * 255).astype(np.uint8)
+
+
+class Envelope:
+    """A track's analyzed levels; envelope[frame] is the Sound at that simulation step, looping."""
+
+    def __init__(self, levels):
+        self.levels = levels
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __getitem__(self, frame):
+        return Sound(*(level / 255 for level in self.levels[frame % len(self.levels)].tolist()))
+
+
+# --- Offline analysis cache ---
+class AudioEnvelopes:
+    """Per-frame band energies and onsets of each scene's music, analyzed once per track.
+
+    Analysis decodes the whole track and runs NumPy FFTs over it, so it is
+    done ahead of the render loop and saved to cache_dir as a .npy named after
+    the track's path, mtime and the analysis settings.  Later runs memory-map
+    that file instead, and looking up a frame is a single row read.
+    Off until `enabled` is set (--audio-reactive); disabled, every scene hears QUIET.
+    """
+
+    def __init__(self, fps, cache_dir=CACHE_DIR):
+        self.fps = fps
+        self.cache_dir = cache_dir
+        self.enabled = False
+        self.envelopes = {}
+        self.loading = {}  # path -> lock held while that track is analyzed
+        self.lock = threading.RLock()  # scenes are built on the preloader thread too
+
+    def envelope(self, path):
+        """The Envelope for the track at path, or None if disabled or the track can't be decoded."""
+        if not self.enabled or not path:
+            return None
+        with self.lock:
+            loading = self.loading.setdefault(path, threading.Lock())
+        # Decoding and analysis take seconds, so only callers after the same track wait for it
+        with loading:
+            if path not in self.envelopes:
+                self.envelopes[path] = self.load(path)
+            return self.envelopes[path]
+
+    def prepare(self, paths):
+        """Analyze the tracks in paths on a background thread, where paths is iterated, so scene changes find them cached."""
+        if self.enabled:
+            threading.Thread(target=lambda: [self.envelope(path) for path in paths], daemon=True).start()
+
+    def load(self, path):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None  # track not installed
+        settings = f"{os.path.abspath(path)}|{self.fps}|{BANDS}|{WINDOW}"
+        stem = hashlib.sha1(settings.encode()).hexdigest()
+        cached = os.path.join(self.cache_dir, f"{stem}-{mtime}.npy")
+        try:
+            return Envelope(np.load(cached, mmap_mode="r"))
+        except (OSError, ValueError):
+            pass  # not analyzed yet
+
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            rate = pygame.mixer.get_init()[0]
+            samples = pygame.sndarray.array(pygame.mixer.Sound(path))
+        except pygame.error:
+            return None  # no audio device to decode with, or not a format SDL_mixer reads
+        levels = analyze(samples, rate, self.fps)
+        if not len(levels):
+            return None
+        save_cache_file(cached, stem, lambda f: np.save(f, levels))
+        return Envelope(levels)
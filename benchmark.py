@@ -0,0 +1,173 @@
+"""Deterministic per-scene benchmarks with regression checks against a stored baseline.
+
+    python benchmark.py                            # every scene at 1920x1080, compare to baseline
+    python benchmark.py --size 1280x720 --size 3840x2160 --frames 300
+    python benchmark.py --scene MultiRosePattern --save     # record/refresh the baseline
+
+Each scene is seeded, built headlessly and run for --frames update+draw frames
+(after --warmup frames that aren't timed).  A second pass with the same seed
+measures the peak Python/NumPy heap with tracemalloc, kept out of the timed
+pass because tracing slows everything down.  tracemalloc can't see SDL
+surface pixels, where most of the memory goes, so a third pass runs the scene
+in a fresh process and reports that process's peak resident size (on
+platforms with the resource module).  Sprite caches are emptied between
+scenes so one scene can't warm another, and what a scene leaves in them is
+reported as its atlas size.  Exits with status 1 if any scene is slower, or
+has a bigger heap, RSS or atlas, than the baseline by more than --tolerance.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import numpy as np
+
+import main
+import scenes
+import stage
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+# Out of the playlist, but still worth keeping an eye on
+EXTRA_SCENES = ["SoftLayeredBloom", "ButterflySwarmScene"]
+
+
+def reset_caches():
+    stage.sprites.clear()
+    stage.vortex_sprites.clear()
+    stage.petal_textures.atlas.clear()
+    stage.assets.clear()
+
+
+def run_scene(cls, seed, frames, warmup, surface, timed=True):
+    reset_caches()
+    random.seed(seed)
+    pattern = cls()
+    times = []
+    for frame in range(warmup + frames):
+        stage.sim_frame = frame
+        start = time.perf_counter()
+        surface.fill((10, 10, 30))
+        pattern.update()
+        pattern.draw(surface)
+        if timed and frame >= warmup:
+            times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def scene_rss(name, size, seed, frames, warmup):
+    """Peak resident size in MB of a process that only runs scene name, untimed."""
+    stage.init_display(headless=True, size=size)
+    run_scene(scenes.load(name), seed, frames, warmup, stage.screen, timed=False)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10  # bytes on macOS, KB elsewhere
+
+
+def peak_rss(cls, seed, frames, warmup):
+    """scene_rss() in a new process, so no other scene's surfaces count; None without resource."""
+    if resource is None:
+        return None
+    with ProcessPoolExecutor(1, mp.get_context("spawn")) as pool:
+        return pool.submit(scene_rss, cls.__name__, stage.screen.get_size(), seed, frames, warmup).result()
+
+
+def measure(cls, seed, frames, warmup):
+    surface = stage.screen
+    times = run_scene(cls, seed, frames, warmup, surface)
+    atlas_mb = (stage.sprites.used + stage.vortex_sprites.used + stage.petal_textures.atlas.used) / 2 ** 20
+
+    tracemalloc.start()
+    run_scene(cls, seed, frames, warmup, surface, timed=False)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = peak_rss(cls, seed, frames, warmup)
+
+    p50, p95, p99 = np.percentile(times, (50, 95, 99))
+    result = {
+        'mean_ms': round(float(np.mean(times)), 3),
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'peak_heap_mb': round(peak / 2 ** 20, 2),
+        'atlas_mb': round(atlas_mb, 2),
+    }
+    if rss is not None:
+        result['peak_rss_mb'] = round(rss, 1)
+    return result
+
+
+def regressions(result, base, tolerance):
+    """Metrics in result that are worse than base by more than tolerance (a fraction)."""
+    worse = []
+    # Sprite pixels live in SDL surfaces, which tracemalloc doesn't see, so the
+    # process's peak RSS and the atlases' size are checked alongside the heap
+    for metric in ('mean_ms', 'p95_ms', 'peak_heap_mb', 'peak_rss_mb', 'atlas_mb'):
+        if metric in base and metric in result and result[metric] > base[metric] * (1 + tolerance):
+            worse.append(f"{metric} {base[metric]} -> {result[metric]}")
+    return worse
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scene", action="append", help="scene class name (repeatable; default all)")
+    parser.add_argument("--size", action="append", type=main.parse_size,
+                        help="resolution WIDTHxHEIGHT (repeatable; default 1920x1080)")
+    parser.add_argument("--frames", type=int, default=240, help="timed frames per scene (default 240)")
+    parser.add_argument("--warmup", type=int, default=30, help="untimed frames first (default 30)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed slowdown/growth over baseline as a fraction (default 0.15)")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="write these results into the baseline")
+    args = parser.parse_args()
+
+    names = scenes.PLAYLIST + EXTRA_SCENES
+    if args.scene:
+        unknown = [name for name in args.scene if name not in scenes.REGISTRY]
+        if unknown:
+            sys.exit(f"Unknown scene(s): {', '.join(unknown)}")
+        names = args.scene
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    failed = False
+    for size in args.size or [(1920, 1080)]:
+        resolution = f"{size[0]}x{size[1]}"
+        stage.init_display(headless=True, size=size)
+        print(f"\n{resolution}, {args.frames} frames, seed {args.seed}")
+        print(f"{'scene':<24}{'mean':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'heap MB':>9}{'RSS MB':>8}{'atlas MB':>10}")
+        for cls in map(scenes.load, names):
+            result = measure(cls, args.seed, args.frames, args.warmup)
+            base = baseline.get(resolution, {}).get(cls.__name__)
+            worse = regressions(result, base, args.tolerance) if base else []
+            status = "REGRESSION: " + ", ".join(worse) if worse else ("ok" if base else "(no baseline)")
+            failed |= bool(worse)
+            print(f"{cls.__name__:<24}{result['mean_ms']:>8.2f}{result['p50_ms']:>8.2f}{result['p95_ms']:>8.2f}"
+                  f"{result['p99_ms']:>8.2f}{result['peak_heap_mb']:>9.1f}{result.get('peak_rss_mb', '-'):>8}"
+                  f"{result['atlas_mb']:>10.1f}  {status}")
+            if args.save:
+                baseline.setdefault(resolution, {})[cls.__name__] = result
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.baseline}")
+    elif failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
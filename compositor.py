@@ -0,0 +1,68 @@
+import pygame
+
+# How a layer combines with what's under it.  Opacity only applies to "normal";
+# the arithmetic modes take the layer's colors as they are.
+BLEND_MODES = {
+    "normal": 0,
+    "add": pygame.BLEND_ADD,
+    "subtract": pygame.BLEND_SUB,
+    "multiply": pygame.BLEND_MULT,
+    "lighten": pygame.BLEND_MAX,
+    "darken": pygame.BLEND_MIN,
+}
+
+
+# --- Full-screen layers ---
+class Compositor:
+    """Named screen-sized layers, allocated once and blended onto the frame.
+
+    layer() hands out a surface that lives as long as the compositor, so
+    nothing screen-sized is allocated per frame.  wash() covers the frame with
+    a flat color (fades, flashes) using one preallocated solid layer per
+    color.  fuse() bakes a background and any constant overlays on top of it
+    into a layer once, so scenes blit a single opaque surface per frame.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.layers = {}
+        self.fused = {}  # layer name -> what it was fused from
+
+    def layer(self, name, alpha=False):
+        """The preallocated layer called name, created on first use."""
+        surf = self.layers.get(name)
+        if surf is None:
+            surf = pygame.Surface(self.size, pygame.SRCALPHA if alpha else 0)
+            surf = surf.convert_alpha() if alpha else surf.convert()
+            self.layers[name] = surf
+        return surf
+
+    def solid(self, color):
+        color = tuple(color)
+        surf = self.layers.get(("solid", color))
+        if surf is None:
+            surf = self.layer(("solid", color))
+            surf.fill(color)
+        return surf
+
+    def wash(self, surface, color, opacity=255, blend="normal"):
+        """Cover surface with a flat color, e.g. a fade to black or a white flash."""
+        if opacity <= 0:
+            return
+        layer = self.solid(color)
+        layer.set_alpha(opacity if blend == "normal" else None)
+        surface.blit(layer, (0, 0), special_flags=BLEND_MODES[blend])
+
+    def fuse(self, name, background, *overlays):
+        """Bake background plus overlays (color, opacity, blend) into layer name, once.
+
+        Asking again with the same background and overlays reuses the baked layer.
+        """
+        recipe = (background, overlays)
+        layer = self.layer(name)
+        if self.fused.get(name) != recipe:
+            layer.blit(background, (0, 0))
+            for color, opacity, blend in overlays:
+                self.wash(layer, color, opacity, blend)
+            self.fused[name] = recipe
+        return layer
@@ -0,0 +1,99 @@
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+import raster
+from palette import hues_to_rgb
+
+
+# One frame of a curve: integer screen positions, (n, 3) uint8 colors and dot radii
+CurveBatch = namedtuple("CurveBatch", "x y colors radii")
+
+
+def _frozen(*arrays):
+    for a in arrays:
+        a.setflags(write=False)
+    return arrays
+
+
+# --- Unit curves, computed once per parameter set ---
+@lru_cache(maxsize=256)
+def rose_basis(k, samples):
+    """cos(k*theta), cos(theta), sin(theta) for theta over one turn."""
+    theta = np.arange(samples) / samples * 2 * np.pi
+    return _frozen(np.cos(k * theta), np.cos(theta), np.sin(theta))
+
+
+@lru_cache(maxsize=256)
+def lissajous_basis(freq_x, freq_y, samples):
+    """sin/cos of freq_x*t and sin of freq_y*t; delta is added later by angle sum."""
+    t = np.arange(samples) * 2 * np.pi / samples
+    return _frozen(np.sin(freq_x * t), np.cos(freq_x * t), np.sin(freq_y * t))
+
+
+@lru_cache(maxsize=256)
+def spiral_basis(arms, samples):
+    """Fraction along the spiral and cos/sin of its arm angle, two full turns out."""
+    frac = np.arange(samples) / samples
+    t = frac * 4 * np.pi * arms
+    return _frozen(frac, np.cos(t), np.sin(t))
+
+
+@lru_cache(maxsize=16)
+def ramp(samples):
+    return _frozen(np.arange(samples, dtype=np.float64))[0]
+
+
+# --- Per-frame transforms ---
+def rose(k, size, rotation, center, hue_offset, color_speed, samples=800):
+    ck, cos_t, sin_t = rose_basis(k, samples)
+    cr, sr = np.cos(rotation), np.sin(rotation)
+    r = size * ck
+    # cos/sin(theta + rotation) by angle sum, so the trig stays in the cached basis
+    x = (center[0] + r * (cos_t * cr - sin_t * sr)).astype(np.int32)
+    y = (center[1] + r * (sin_t * cr + cos_t * sr)).astype(np.int32)
+    hues = (ramp(samples) * color_speed + hue_offset) % 360
+    radii = np.maximum(1, (np.abs(r) / 80).astype(np.int32))
+    return CurveBatch(x, y, hues_to_rgb(hues, 100, 100), radii)
+
+
+@lru_cache(maxsize=16)
+def lissajous_radii(samples):
+    return _frozen((2 + 2 * np.sin(np.arange(samples) * 0.01)).astype(np.int32))[0]
+
+
+def lissajous(freq_x, freq_y, a, b, delta, center, hue_offset, samples=1000):
+    sx, cx, sy = lissajous_basis(freq_x, freq_y, samples)
+    x = (center[0] + a * (sx * np.cos(delta) + cx * np.sin(delta))).astype(np.int32)
+    y = (center[1] + b * sy).astype(np.int32)
+    hues = (ramp(samples) + hue_offset) % 360
+    return CurveBatch(x, y, hues_to_rgb(hues, 100, 100), lissajous_radii(samples))
+
+
+def spiral(arms, radius, angle, center, hue, samples=100):
+    frac, cos_t, sin_t = spiral_basis(arms, samples)
+    r = radius * frac
+    ca, sa = np.cos(angle), np.sin(angle)
+    x = (center[0] + r * (cos_t * ca - sin_t * sa)).astype(np.int32)
+    y = (center[1] + r * (sin_t * ca + cos_t * sa)).astype(np.int32)
+    hues = (hue + ramp(samples) * 2) % 360
+    radii = np.maximum(1, (r / 20).astype(np.int32))
+    return CurveBatch(x, y, hues_to_rgb(hues, 80, 100), radii)
+
+
+def visible(batch, width, height):
+    mask = (batch.x >= 0) & (batch.x < width) & (batch.y >= 0) & (batch.y < height)
+    return CurveBatch(batch.x[mask], batch.y[mask], batch.colors[mask], batch.radii[mask])
+
+
+def draw_dots(surface, batch, blend=None):
+    """One filled circle per on-screen sample, rasterized as a single batch (see raster.draw_discs)."""
+    w, h = surface.get_size()
+    on = visible(batch, w, h)
+    raster.draw_discs(surface, on.x, on.y, on.radii, on.colors, blend)
+
+
+def draw_trail(surface, batch, width=2):
+    """Segments joining consecutive samples, each in the color of its end point, rasterized as one batch."""
+    raster.draw_segments(surface, batch.x[:-1], batch.y[:-1], batch.x[1:], batch.y[1:], batch.colors[1:], width)
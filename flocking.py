@@ -0,0 +1,115 @@
+import numpy as np
+
+
+# --- Boids over a uniform-grid spatial hash ---
+class Flock:
+    """Boids (separation, alignment, cohesion) for thousands of agents, one NumPy batch per step.
+
+    Positions and velocities are (n, 2) arrays.  Each step hashes every agent
+    into a grid of radius-sized cells, sorts them by cell, and only compares
+    agents in neighbouring cells, so finding neighbours is O(n) rather than
+    comparing every pair.  Steering sums are gathered per
+    agent with np.bincount and applied to all velocities at once.  Agents
+    turn back from within margin of the edges instead of bouncing.
+    """
+
+    def __init__(self, n, bounds, rng, radius=40, separation=14, min_speed=1.0, max_speed=3.0,
+                 cohesion=0.004, alignment=0.06, avoidance=0.6, margin=60, turn=0.15):
+        self.bounds = bounds
+        self.radius = radius
+        self.separation = separation
+        self.min_speed = min_speed
+        self.max_speed = max_speed
+        self.cohesion = cohesion
+        self.alignment = alignment
+        self.avoidance = avoidance
+        self.margin = margin
+        self.turn = turn
+        self.pos = rng.uniform((0, 0), bounds, (n, 2))
+        heading = rng.uniform(0, 2 * np.pi, n)
+        speed = rng.uniform(min_speed, max_speed, n)
+        self.vel = np.column_stack((np.cos(heading), np.sin(heading))) * speed[:, None]
+        # Grid with a spare ring of cells, so every agent's 3x3 block stays in range
+        self.cols = int(np.ceil(bounds[0] / radius)) + 2
+        self.rows = int(np.ceil(bounds[1] / radius)) + 2
+
+    def __len__(self):
+        return len(self.pos)
+
+    def neighbours(self, active=None):
+        """Every ordered pair of distinct agents closer than radius, as arrays (i, j, dx, dy).
+
+        dx, dy is the offset from agent i to agent j.  Only the first active
+        agents (all by default) are considered.
+        """
+        x, y = self.pos[:active, 0], self.pos[:active, 1]
+        n = len(x)
+        cx = np.clip((x // self.radius).astype(np.int64), 0, self.cols - 3) + 1
+        cy = np.clip((y // self.radius).astype(np.int64), 0, self.rows - 3) + 1
+        cell = cx * self.rows + cy
+        order = np.argsort(cell, kind="stable")
+        counts = np.bincount(cell, minlength=self.cols * self.rows)
+        starts = np.cumsum(counts) - counts  # where each cell's agents begin in order
+
+        found = []
+        agents = np.arange(n)
+        # Half of the 3x3 block: each pair of cells is visited once and its pairs mirrored after
+        for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+            other = cell + dx * self.rows + dy
+            c = counts[other]
+            total = int(c.sum())
+            if not total:
+                continue
+            # Expand every agent into one candidate per agent in that neighbouring cell
+            first = np.cumsum(c) - c
+            i = np.repeat(agents, c)
+            j = order[np.repeat(starts[other] - first, c) + np.arange(total)]
+            ox = x[j] - np.repeat(x, c)
+            oy = y[j] - np.repeat(y, c)
+            near = ox * ox + oy * oy < self.radius ** 2
+            if dx == dy == 0:
+                near &= j > i
+            found.append((i[near], j[near], ox[near], oy[near]))
+        if not found:
+            return agents[:0], agents[:0], x[:0], y[:0]
+        i, j, ox, oy = (np.concatenate(parts) for parts in zip(*found))
+        return np.concatenate((i, j)), np.concatenate((j, i)), np.concatenate((ox, -ox)), np.concatenate((oy, -oy))
+
+    def step(self, speed_scale=1.0, active=None):
+        """Steer every agent from its neighbours, then move it; speed_scale stretches the speed limits.
+
+        With active, only the first active agents fly and the rest hold still,
+        e.g. while a lower level of detail leaves them undrawn.
+        """
+        pos, vel = self.pos[:active], self.vel[:active]
+        n = len(pos)
+        i, j, ox, oy = self.neighbours(active)
+        steer = np.zeros_like(vel)
+        if len(i):
+            count = np.bincount(i, minlength=n)
+            has = count > 0
+            total = np.maximum(count, 1)
+            # Toward the neighbours' centre, and toward their average velocity
+            steer[:, 0] = np.bincount(i, ox, n) / total * self.cohesion
+            steer[:, 1] = np.bincount(i, oy, n) / total * self.cohesion
+            for k in (0, 1):
+                steer[has, k] += (np.bincount(i, vel[j, k], n)[has] / count[has] - vel[has, k]) * self.alignment
+
+            # Push apart from anyone inside the separation distance, harder the closer they are
+            dist2 = ox * ox + oy * oy
+            close = dist2 < self.separation ** 2
+            push = self.avoidance * self.separation / np.maximum(dist2[close], 1.0)
+            steer[:, 0] -= np.bincount(i[close], ox[close] * push, n)
+            steer[:, 1] -= np.bincount(i[close], oy[close] * push, n)
+
+        w, h = self.bounds
+        steer[pos[:, 0] < self.margin, 0] += self.turn
+        steer[pos[:, 0] > w - self.margin, 0] -= self.turn
+        steer[pos[:, 1] < self.margin, 1] += self.turn
+        steer[pos[:, 1] > h - self.margin, 1] -= self.turn
+
+        vel += steer
+        speed = np.sqrt(np.einsum("ij,ij->i", vel, vel))
+        limit = np.clip(speed, self.min_speed * speed_scale, self.max_speed * speed_scale)
+        vel *= (limit / np.maximum(speed, 1e-9))[:, None]
+        pos += vel
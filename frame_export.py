@@ -0,0 +1,56 @@
+import os
+import shlex
+import subprocess
+import sys
+
+import pygame
+
+
+# --- Frame writers for headless rendering ---
+class PNGSequenceWriter:
+    """Saves each frame as out_dir/frame_000000.png, frame_000001.png, ..."""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.index = 0
+        os.makedirs(out_dir, exist_ok=True)
+
+    def write(self, surface):
+        path = os.path.join(self.out_dir, f"frame_{self.index:06d}.png")
+        pygame.image.save(surface, path)
+        self.index += 1
+
+    def close(self):
+        pass
+
+
+class RawRGBWriter:
+    """Streams frames as packed rgb24 bytes to stdout or to an encoder's stdin.
+
+    Example encoder command for a 1920x1080 show at 60 FPS:
+        ffmpeg -f rawvideo -pix_fmt rgb24 -s 1920x1080 -r 60 -i - loop.mp4
+    """
+
+    def __init__(self, command=None):
+        self.process = None
+        if command:
+            self.process = subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE)
+            self.stream = self.process.stdin
+        else:
+            self.stream = sys.stdout.buffer
+
+    def write(self, surface):
+        self.stream.write(pygame.image.tobytes(surface, "RGB"))
+
+    def close(self):
+        self.stream.flush()
+        if self.process:
+            self.process.stdin.close()
+            self.process.wait()
+
+
+def open_frame_writer(out_dir=None, pipe=None, raw=False):
+    """Pick a writer from the command line options (PNG sequence by default)."""
+    if pipe or raw:
+        return RawRGBWriter(pipe)
+    return PNGSequenceWriter(out_dir or "frames")
@@ -0,0 +1,78 @@
+# --- Adaptive level of detail ---
+class LODGovernor:
+    """Steps each scene's level of detail down when frames run over budget, and back up with headroom.
+
+    Frame times are smoothed with an exponential moving average.  Dropping a
+    level needs `drop_after` consecutive frames over budget; raising one needs
+    `raise_after` consecutive frames under `headroom` x budget, doubled for
+    every time the level above has already had to be abandoned, so a scene on
+    the edge of the budget settles below it instead of oscillating.
+    Every change is followed by a `cooldown`, so the smoothed time reflects the
+    new level before the next decision.  Levels are remembered per scene, so a
+    heavy scene coming round again starts where it settled last time.
+    """
+
+    LEVELS = (0.25, 0.35, 0.5, 0.7, 0.85, 1.0)
+
+    def __init__(self, budget_ms, headroom=0.6, drop_after=30, raise_after=180, cooldown=60, smoothing=0.1):
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.drop_after = drop_after
+        self.raise_after = raise_after
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.scene_levels = {}
+        self.failures = {}  # (scene, level index) -> times it had to drop from that level
+        self.scene = None
+        self.index = len(self.LEVELS) - 1
+        self.ema = None
+        self.over = self.under = self.wait = 0
+
+    @property
+    def level(self):
+        return self.LEVELS[self.index]
+
+    def level_for(self, scene):
+        """The level scene would start at, without switching to it."""
+        return self.LEVELS[self.scene_levels.get(scene, len(self.LEVELS) - 1)]
+
+    def start_scene(self, scene):
+        """Switch to scene's remembered level (full detail the first time) and return it."""
+        self.scene = scene
+        self.index = self.scene_levels.get(scene, len(self.LEVELS) - 1)
+        self.ema = None
+        self.over = self.under = 0
+        self.wait = self.cooldown
+        return self.level
+
+    def observe(self, frame_ms):
+        """Feed one frame's work time; returns the new level when it changes, else None."""
+        self.ema = frame_ms if self.ema is None else self.ema + self.smoothing * (frame_ms - self.ema)
+        if self.wait:
+            self.wait -= 1
+            return None
+
+        if self.ema > self.budget_ms:
+            self.over += 1
+            self.under = 0
+        elif self.ema < self.budget_ms * self.headroom:
+            self.under += 1
+            self.over = 0
+        else:
+            self.over = self.under = 0
+
+        if self.over >= self.drop_after and self.index > 0:
+            failed = (self.scene, self.index)
+            self.failures[failed] = self.failures.get(failed, 0) + 1
+            return self.step(-1)
+        needed = self.raise_after * 2 ** self.failures.get((self.scene, self.index + 1), 0)
+        if self.under >= needed and self.index < len(self.LEVELS) - 1:
+            return self.step(1)
+        return None
+
+    def step(self, direction):
+        self.index += direction
+        self.scene_levels[self.scene] = self.index
+        self.over = self.under = 0
+        self.wait = self.cooldown
+        return self.level
@@ -0,0 +1,67 @@
+from functools import lru_cache
+
+import numpy as np
+import pygame
+
+# Hue resolution of the lookup tables and of cached Colors: 0.25 degree
+STEPS_PER_DEGREE = 4
+HUE_STEPS = 360 * STEPS_PER_DEGREE
+
+
+def hsv_to_rgb(h, s, v):
+    """Scalar HSV -> RGB floats in 0-1.  h in degrees, s and v in 0-100."""
+    h, s, v = float(h), float(s)/100, float(v)/100
+    hi = int(h / 60) % 6
+    f = h / 60 - hi
+    p, q, t = v * (1 - s), v * (1 - f * s), v * (1 - (1 - f) * s)
+    return [(v,t,p),(q,v,p),(p,v,t),(p,q,v),(t,p,v),(v,p,q)][hi]
+
+
+def hsv_to_rgb_array(h, s=100, v=100):
+    """Vectorized HSV -> RGB.  h in degrees, s and v in 0-100 like pygame.Color.hsva.
+
+    Returns an (n, 3) uint8 array.  Exact, but hues_to_rgb is cheaper for fixed s and v.
+    """
+    h = np.asarray(h, dtype=np.float64) % 360 / 60
+    s = np.asarray(s, dtype=np.float64) / 100
+    v = np.asarray(v, dtype=np.float64) / 100
+    sector = np.floor(h)
+    f = h - sector
+    i = sector.astype(np.int64) % 6
+    p = v * (1 - s)
+    q = v * (1 - f * s)
+    t = v * (1 - (1 - f) * s)
+    v = np.broadcast_to(v, h.shape)
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    return (np.stack([r, g, b], axis=-1) * 255 + 0.5).astype(np.uint8)
+
+
+@lru_cache(maxsize=64)
+def hue_lut(s=100, v=100):
+    """RGB for every hue step at one (saturation, value) profile, shape (HUE_STEPS, 3)."""
+    lut = hsv_to_rgb_array(np.arange(HUE_STEPS) / STEPS_PER_DEGREE, s, v)
+    lut.setflags(write=False)
+    return lut
+
+
+def hues_to_rgb(hues, s=100, v=100):
+    """Table lookup for an array of hues (degrees, any range) -> (n, 3) uint8."""
+    index = np.rint(np.asarray(hues) * STEPS_PER_DEGREE).astype(np.int64) % HUE_STEPS
+    return hue_lut(s, v)[index]
+
+
+def hsv_color(h, s=100, v=100, a=100):
+    """Shared pygame.Color for a scalar HSVA (pygame's 0-360 / 0-100 ranges).
+
+    Colors are cached per quarter degree of hue, so callers must not modify them.
+    """
+    return _cached_color(round(h * STEPS_PER_DEGREE) % HUE_STEPS, s, v, a)
+
+
+@lru_cache(maxsize=16384)
+def _cached_color(step, s, v, a):
+    color = pygame.Color(0)
+    color.hsva = (step / STEPS_PER_DEGREE, s, v, a)
+    return color
@@ -0,0 +1,80 @@
+from itertools import repeat
+
+import numpy as np
+import pygame
+
+
+# --- Struct-of-arrays particle pool ---
+class ParticleSystem:
+    """Fixed-capacity particle pool with one preallocated NumPy array per attribute.
+
+    Live particles are always packed into the first `count` slots: spawn() writes
+    after them and cull() compacts the survivors down, so the pool never
+    reallocates while particles come and go.  Attribute views (ps.x, ps.hue, ...)
+    cover only the live slots and can be updated in place.
+    """
+
+    def __init__(self, capacity, **fields):
+        self.capacity = capacity
+        self.count = 0
+        self.arrays = {name: np.zeros(capacity, dtype=dtype) for name, dtype in fields.items()}
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['arrays'][name][:self.__dict__['count']]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        # Makes `ps.alpha -= 0.8` write into the pool instead of shadowing it
+        arrays = self.__dict__.get('arrays')
+        if arrays is not None and name in arrays:
+            arrays[name][:self.count] = value
+        else:
+            super().__setattr__(name, value)
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, n, **values):
+        """Add up to n particles (fewer if the pool is full); values are scalars or length-n arrays.
+
+        Fields not given start at zero.  Returns the number actually spawned.
+        """
+        n = min(n, self.capacity - self.count)
+        if n <= 0:
+            return 0
+        start, stop = self.count, self.count + n
+        for name, arr in self.arrays.items():
+            value = values.get(name, 0)
+            arr[start:stop] = value[:n] if np.ndim(value) else value
+        self.count = stop
+        return n
+
+    def cull(self, alive):
+        """Keep only the live particles where alive (a mask over the live slots) is true."""
+        keep = np.flatnonzero(alive)
+        if len(keep) == self.count:
+            return
+        for arr in self.arrays.values():
+            arr[:len(keep)] = arr[keep]
+        self.count = len(keep)
+
+    def clear(self):
+        self.count = 0
+
+    def draw_sprites(self, surface, sprites, index, x, y, special_flags=pygame.BLEND_ADD):
+        """Blit sprites[index[i]] at top-left (x[i], y[i]) for every live particle in one blits() call.
+
+        With the default BLEND_ADD, plain (non-alpha) sprites on black add their light
+        onto the target, which is the cheapest way to stamp glows in bulk.  It is
+        still one blit per particle, roughly 0.3-0.4 us each, so around 20k particles
+        fill half a 60 FPS frame; size pools to what the frame can draw.
+        """
+        if not self.count:
+            return
+        surface.blits(
+            zip(map(sprites.__getitem__, index.tolist()), zip(x.tolist(), y.tolist()),
+                repeat(None), repeat(special_flags)),
+            doreturn=False,
+        )
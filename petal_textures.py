@@ -0,0 +1,63 @@
+import math
+from collections import namedtuple
+
+import pygame
+
+from palette import hsv_to_rgb
+from sprite_atlas import SpriteAtlas
+
+
+# How a gradient petal fades from its base color to its tip color.
+#   steps     - number of nested ellipses in the gradient
+#   hue_shift - tip hue relative to the base hue
+#   sat, val / end_sat, end_val - HSV (0-100) at the base and at the tip
+#   anchor    - petal center as a fraction of size inside its (2*size)^2 texture
+GradientProfile = namedtuple("GradientProfile", "steps hue_shift sat val end_sat end_val anchor")
+
+MANDALA_PETAL = GradientProfile(12, 40, 80, 100, 70, 60, 1.0)
+FLOWER_PETAL = GradientProfile(6, 30, 70, 100, 70, 60, 0.5)
+
+
+def render_gradient_petal(hue, size, profile):
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    r1, g1, b1 = hsv_to_rgb(hue, profile.sat, profile.val)
+    r2, g2, b2 = hsv_to_rgb((hue + profile.hue_shift) % 360, profile.end_sat, profile.end_val)
+    c = int(size * profile.anchor)
+    for i in range(profile.steps):
+        t = i / profile.steps
+        r = int(max(0, min(255, (1 - t) * r1 * 255 + t * r2 * 255)))
+        g = int(max(0, min(255, (1 - t) * g1 * 255 + t * g2 * 255)))
+        b = int(max(0, min(255, (1 - t) * b1 * 255 + t * b2 * 255)))
+        a = int(255 * (1 - t))
+        pygame.draw.ellipse(
+            surf, (r, g, b, a),
+            (c - size * 0.5 * (1 - t), c - size * (1 - t), size * (1 - t), size * 2 * (1 - t))
+        )
+    return surf
+
+
+class PetalTextures:
+    """Gradient petals rendered once per (hue, size, profile) and rotated through an atlas.
+
+    Finer scale steps than the default atlas so growing flowers don't visibly pop.
+    """
+
+    def __init__(self, budget_mb=96, angle_step=3.0, scale_step=0.02):
+        self.atlas = SpriteAtlas(budget_mb, angle_step, scale_step)
+
+    def petal(self, hue, size, profile, angle, scale):
+        """The petal pointing along angle (radians), scaled by scale."""
+        return self.atlas.get(("gradient", hue, size, profile), -math.degrees(angle), scale,
+                              render_gradient_petal, hue, size, profile)
+
+    def draw_ring(self, surface, center, radius, count, phase, hue, size, profile, scale):
+        """count petals evenly around center, the first at phase radians, in one blits() call."""
+        cx, cy = center
+        blits = []
+        for i in range(count):
+            angle = 2 * math.pi * i / count + phase
+            x = cx + math.cos(angle) * radius
+            y = cy + math.sin(angle) * radius
+            rotated = self.petal(hue, size, profile, angle, scale)
+            blits.append((rotated, rotated.get_rect(center=(int(x), int(y)))))
+        surface.blits(blits, doreturn=False)
@@ -0,0 +1,47 @@
+import threading
+
+
+# --- Background construction of the next scene ---
+class ScenePreloader:
+    """Builds the next scene on a background thread so the swap to it doesn't hitch.
+
+    request(index) starts building it (asset loads, scaling, sprite baking,
+    noise tables); take(index) hands it over, waiting for the build if it is
+    still running and building inline if it was never requested.  One scene is
+    held at a time: requesting a different one discards the previous build.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.index = None
+        self.thread = None
+        self.result = None
+        self.error = None
+
+    def request(self, index):
+        if index == self.index:
+            return
+        self.discard()
+        self.index = index
+        self.thread = threading.Thread(target=self._run, args=(index,), name="scene-preload", daemon=True)
+        self.thread.start()
+
+    def _run(self, index):
+        try:
+            self.result = self.build(index)
+        except Exception as e:  # re-raised on the main thread by take()
+            self.error = e
+
+    def take(self, index):
+        self.request(index)
+        self.thread.join()
+        result, error = self.result, self.error
+        self.index = self.thread = self.result = self.error = None
+        if error is not None:
+            raise error
+        return result
+
+    def discard(self):
+        if self.thread is not None:
+            self.thread.join()
+        self.index = self.thread = self.result = self.error = None
@@ -0,0 +1,142 @@
+import csv
+import json
+import platform
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+
+
+# --- Per-phase frame timing ---
+class FrameProfiler:
+    """Times the phases of every frame, tagged with the scene that was showing.
+
+    A frame is start_frame(scene), then lap(phase) after each phase, then
+    end_frame().  Recent samples feed the rolling percentiles on the HUD; every
+    sample also lands in a fixed-size histogram per (scene, phase), so memory
+    stays flat however long the show runs and dump() can report whole-run
+    percentiles.  All calls are no-ops unless enabled.
+    """
+
+    BIN_MS = 0.1   # histogram resolution
+    MAX_MS = 500   # anything slower lands in the last bin
+
+    def __init__(self, budget_ms, window=300, enabled=False):
+        self.budget_ms = budget_ms
+        self.window = window
+        self.enabled = enabled
+        self.recent = defaultdict(lambda: deque(maxlen=self.window))
+        self.histograms = {}
+        self.totals = defaultdict(float)
+        self.peaks = defaultdict(float)
+        self.over_budget = defaultdict(int)
+        self.pending = defaultdict(float)
+        self.scene = None
+        self.frame_start = self.last = 0.0
+
+    def start_frame(self, scene):
+        if not self.enabled:
+            return
+        self.scene = scene
+        self.frame_start = self.last = time.perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the previous lap (or frame start) to phase."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.record(phase, (now - self.last) * 1000)
+        self.last = now
+
+    def split(self, phase):
+        """Like lap, but adds to phase's total for this frame, for phases that interleave in a loop.
+
+        The totals are recorded by flush().
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.pending[phase] += (now - self.last) * 1000
+        self.last = now
+
+    def flush(self, *phases):
+        """Record each of phases' split() total for this frame, 0 for any that didn't run."""
+        if not self.enabled:
+            return
+        for phase in phases:
+            self.record(phase, self.pending.pop(phase, 0.0))
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        ms = (time.perf_counter() - self.frame_start) * 1000
+        self.record("frame", ms)
+        if ms > self.budget_ms:
+            self.over_budget[self.scene] += 1
+
+    def record(self, phase, ms):
+        key = (self.scene, phase)
+        self.recent[key].append(ms)
+        hist = self.histograms.get(key)
+        if hist is None:
+            hist = self.histograms[key] = np.zeros(int(self.MAX_MS / self.BIN_MS) + 1, dtype=np.int64)
+        hist[min(int(ms / self.BIN_MS), len(hist) - 1)] += 1
+        self.totals[key] += ms
+        if ms > self.peaks[key]:
+            self.peaks[key] = ms
+
+    def rolling(self, phase, scene=None):
+        """(p50, p95, p99) in ms over the last `window` frames of phase, or None before any."""
+        samples = self.recent.get((scene or self.scene, phase))
+        if not samples:
+            return None
+        return tuple(np.percentile(samples, (50, 95, 99)))
+
+    def phases(self, scene=None):
+        scene = scene or self.scene
+        return [phase for s, phase in self.recent if s == scene]
+
+    def percentiles(self, key, qs=(50, 95, 99)):
+        hist = self.histograms[key]
+        cumulative = np.cumsum(hist)
+        ranks = np.asarray(qs) / 100 * cumulative[-1]
+        # Upper edge of the bin holding each rank, but never past the slowest sample seen
+        return [min((np.searchsorted(cumulative, r) + 1) * self.BIN_MS, self.peaks[key]) for r in ranks]
+
+    def summary(self):
+        rows = []
+        for (scene, phase), hist in sorted(self.histograms.items()):
+            key = (scene, phase)
+            frames = int(hist.sum())
+            p50, p95, p99 = self.percentiles(key)
+            rows.append({
+                'scene': scene,
+                'phase': phase,
+                'frames': frames,
+                'mean_ms': round(self.totals[key] / frames, 3),
+                'p50_ms': round(p50, 1),
+                'p95_ms': round(p95, 1),
+                'p99_ms': round(p99, 1),
+                'max_ms': round(self.peaks[key], 3),
+                'over_budget': self.over_budget[scene] if phase == "frame" else "",
+            })
+        return rows
+
+    def dump(self, path, **meta):
+        """Write the whole-run summary to path, as JSON if it ends in .json, else CSV.
+
+        meta (resolution etc.) is stored alongside, with the host and budget added.
+        """
+        meta = {'host': platform.node(), 'machine': platform.machine(),
+                'processor': platform.processor(), 'budget_ms': round(self.budget_ms, 2), **meta}
+        rows = self.summary()
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({'meta': meta, 'phases': rows}, f, indent=2)
+            return
+        with open(path, "w", newline="") as f:
+            fields = list(meta) + (list(rows[0]) if rows else [])
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({**meta, **row})
@@ -0,0 +1,193 @@
+import sys
+from functools import lru_cache
+
+import numpy as np
+import pygame
+
+BLENDS = (None, "alpha", "add")
+
+
+@lru_cache(maxsize=64)
+def disc_offsets(radius):
+    """Pixel offsets (dx, dy) from the centre of a filled circle, exactly as pygame.draw.circle covers them."""
+    size = 2 * radius + 3
+    mask = pygame.Surface((size, size), depth=8)
+    pygame.draw.circle(mask, 1, (radius + 1, radius + 1), radius)
+    dx, dy = np.nonzero(pygame.surfarray.array2d(mask))
+    offsets = (dx - radius - 1).astype(np.int32), (dy - radius - 1).astype(np.int32)
+    for a in offsets:
+        a.setflags(write=False)
+    return offsets
+
+
+@lru_cache(maxsize=16)
+def disc_table(max_radius):
+    """Offsets of every radius up to max_radius back to back, with where each radius starts and its length."""
+    discs = [disc_offsets(radius) for radius in range(max_radius + 1)]
+    counts = np.array([len(dx) for dx, _ in discs])
+    starts = np.cumsum(counts) - counts
+    table = (np.concatenate([dx for dx, _ in discs]), np.concatenate([dy for _, dy in discs]), starts, counts)
+    for a in table:
+        a.setflags(write=False)
+    return table
+
+
+def stamps(x, y, radii, width, height, pitch):
+    """Every covered, on-surface pixel of every disc, in drawing order.
+
+    Returns (disc, index): the disc each pixel belongs to and the pixel's
+    offset in a surface whose rows are pitch pixels apart.  Each disc is
+    expanded into a run of its radius's cached offsets in one gather, so
+    pixels come out in disc order, which later discs covering earlier ones
+    depends on.  Only discs crossing an edge are clipped pixel by pixel.
+    """
+    dx, dy, starts, counts = disc_table(int(radii.max(initial=0)))
+    count = counts[radii]
+    first = np.cumsum(count) - count
+    offset = np.repeat(starts[radii] - first, count) + np.arange(int(count.sum()), dtype=np.int32)
+    disc = np.repeat(np.arange(len(x), dtype=np.int32), count)
+    index = np.repeat(y * pitch + x, count) + (dy * pitch + dx)[offset]
+    edge = (x < radii) | (x + radii >= width) | (y < radii) | (y + radii >= height)
+    if edge.any():
+        crossing = np.flatnonzero(edge[disc])
+        px = x[disc[crossing]] + dx[offset[crossing]]
+        py = y[disc[crossing]] + dy[offset[crossing]]
+        outside = crossing[(px < 0) | (px >= width) | (py < 0) | (py >= height)]
+        disc, index = np.delete(disc, outside), np.delete(index, outside)
+    return disc, index
+
+
+def first_hits(index, slot):
+    """Mask of the entries of index that are the first to touch their pixel; slot is scratch, one int per pixel."""
+    order = np.arange(len(index) - 1, -1, -1, dtype=np.int32)
+    slot[index[::-1]] = order  # written back to front, so the earliest entry is the one that sticks
+    return slot[index] == order[::-1]
+
+
+# --- Batched disc drawing ---
+def draw_discs(surface, x, y, radii, colors, blend=None):
+    """Fill one circle per entry of x, y, radii, colors, as one batch over surface's pixels.
+
+    colors is (n, 3) RGB or (n, 4) RGBA, uint8.  With blend None the discs
+    are opaque and paint exactly the pixels pygame.draw.circle would, later
+    discs over earlier ones.  "alpha" composites each disc by its alpha in
+    drawing order; "add" adds color times alpha, saturating at 255.  Blends
+    take one pass per disc stacked on a pixel, so cost several times the
+    opaque fill.  Parts of discs off the surface are clipped, so callers
+    needn't cull first.  Only the color channels are written; a per-pixel
+    alpha is left as it was.
+    """
+    if blend not in BLENDS:
+        raise ValueError(f"blend must be one of {BLENDS}, not {blend!r}")
+    if surface.get_bytesize() != 4:
+        # Packed 32-bit pixels only; anything else is drawn on a 32-bit copy
+        work = pygame.Surface(surface.get_size(), depth=32)
+        work.blit(surface, (0, 0))
+        draw_discs(work, x, y, radii, colors, blend)
+        surface.blit(work, (0, 0))
+        return
+
+    x = np.asarray(x, np.int32)
+    y = np.asarray(y, np.int32)
+    radii = np.broadcast_to(np.asarray(radii, np.int32), x.shape)
+    colors = np.asarray(colors, np.uint8)
+    width, height = surface.get_size()
+    disc, index = stamps(x, y, radii, width, height, surface.get_pitch() // 4)
+    if not len(disc):
+        return
+
+    if blend is None:
+        fill(surface, disc, index, colors)
+        return
+
+    shifts = surface.get_shifts()[:3]
+    keep = np.uint32(surface.get_masks()[3])
+    pixels = np.frombuffer(surface.get_buffer(), np.uint32)
+    try:
+        channels = [shift // 8 if sys.byteorder == "little" else 3 - shift // 8 for shift in shifts]
+        alpha = colors[disc, 3] * np.float32(1 / 255) if colors.shape[1] > 3 else np.ones(len(disc), np.float32)
+        slot = np.empty(len(pixels), np.int32)
+        # Each pass blends the first disc still waiting at every pixel, so a pixel under
+        # k discs takes k passes but every pass is one batch of distinct pixels
+        waiting = np.arange(len(index))
+        while len(waiting):
+            first = first_hits(index[waiting], slot)
+            now = waiting[first]
+            blend_pixels(pixels, index[now], colors[disc[now], :3] * alpha[now, None],
+                         None if blend == "add" else 1 - alpha[now], channels, keep)
+            waiting = waiting[~first]
+    finally:
+        del pixels  # unlock the surface
+
+
+def fill(surface, owner, index, colors):
+    """Paint pixel index (offsets into surface's packed 32-bit pixels) in colors[owner], later entries winning."""
+    shifts = surface.get_shifts()[:3]
+    keep = np.uint32(surface.get_masks()[3])
+    rgb = np.zeros(len(colors), np.uint32)
+    for c, shift in enumerate(shifts):
+        rgb |= colors[:, c].astype(np.uint32) << np.uint32(shift)
+    pixels = np.frombuffer(surface.get_buffer(), np.uint32)
+    # Assignment with repeated indices keeps the last value
+    pixels[index] = (pixels[index] & keep | rgb[owner]) if keep else rgb[owner]
+    del pixels  # unlock the surface
+
+
+def blend_pixels(pixels, index, added, background, channels, keep):
+    """pixels[index] = pixels[index] * background + added, per color channel, saturating.
+
+    added is (n, 3) in RGB order and channels the byte of each within a pixel.
+    """
+    old = pixels[index]
+    levels = old.view(np.uint8).reshape(-1, 4)[:, channels].astype(np.float32)
+    if background is not None:
+        levels *= background[:, None]
+    levels += added
+    new = old & keep
+    new.view(np.uint8).reshape(-1, 4)[:, channels] = np.minimum(levels + 0.5, 255)
+    pixels[index] = new
+
+
+def segment_pixels(x0, y0, x1, y1, width, size, pitch):
+    """Every on-surface pixel of every line segment, in drawing order, as (segment, index) like stamps().
+
+    Each segment takes one pixel per step along its major axis, from end to
+    end, with the minor coordinate rounded to the nearest pixel.  Every step
+    is widened to width pixels along the minor axis, at offsets
+    -(width - 1) // 2 to width // 2.  The ends are left square.
+    """
+    dx, dy = x1 - x0, y1 - y0
+    length = np.maximum(np.abs(dx), np.abs(dy))
+    count = (length + 1) * width
+    first = np.cumsum(count) - count
+    segment = np.repeat(np.arange(len(x0), dtype=np.int32), count)
+    step = np.arange(int(count.sum()), dtype=np.int32) - np.repeat(first, count)
+    along, across = np.divmod(step, width)
+    across -= (width - 1) // 2
+    # Per-segment slopes, so each pixel is one multiply-add per axis
+    scale = np.float32(1) / np.maximum(length, 1)
+    px = np.rint(x0[segment] + (dx * scale)[segment] * along).astype(np.int32)
+    py = np.rint(y0[segment] + (dy * scale)[segment] * along).astype(np.int32)
+    steep = (np.abs(dy) > np.abs(dx))[segment]
+    px += across * steep
+    py += across * ~steep
+    inside = (px >= 0) & (px < size[0]) & (py >= 0) & (py < size[1])
+    return segment[inside], py[inside] * pitch + px[inside]
+
+
+def draw_segments(surface, x0, y0, x1, y1, colors, width=1):
+    """Draw one opaque line per entry, from (x0, y0) to (x1, y1) in colors (n, 3), as one batch.
+
+    Later segments cover earlier ones and parts off the surface are
+    clipped, as with draw_discs.
+    """
+    if surface.get_bytesize() != 4:
+        work = pygame.Surface(surface.get_size(), depth=32)
+        work.blit(surface, (0, 0))
+        draw_segments(work, x0, y0, x1, y1, colors, width)
+        surface.blit(work, (0, 0))
+        return
+    x0, y0, x1, y1 = (np.asarray(a, np.int32) for a in (x0, y0, x1, y1))
+    segment, index = segment_pixels(x0, y0, x1, y1, width, surface.get_size(), surface.get_pitch() // 4)
+    if len(segment):
+        fill(surface, segment, index, np.asarray(colors, np.uint8))
@@ -0,0 +1,270 @@
+"""Scene rendering in worker processes, handed to the display through shared memory.
+
+Each worker owns a ring of frame slots in a multiprocessing.shared_memory
+block.  It simulates and draws one scene (pattern plus PetalField overlay) at
+a time into its own surface, copies the finished frame into a free slot and
+posts the slot number; the display process wraps every slot as a Surface over
+the shared bytes once, so presenting a frame is a single blit and a flip.
+
+A scene's frames depend on the previous ones, so one scene is always rendered
+by one worker.  Parallelism comes from pipelining: the worker on the current
+scene runs up to `depth` frames ahead of the display, and the other workers
+are already rendering the scenes after it into their own rings, so a
+transition never waits for a constructor.
+
+The overlay isn't reset between scenes in-process, so each worker keeps one
+PetalField across all the scenes it renders.  A worker whose first scene
+isn't the opening one runs its field on by the steps the scenes before it
+last, so that scene doesn't open on a bare sky.
+"""
+import multiprocessing as mp
+import queue
+import random
+import time
+import traceback
+from collections import deque
+from contextlib import ExitStack
+from multiprocessing import shared_memory
+
+import pygame
+
+# Slots are wrapped with pygame.image.frombuffer, which has no BGRX layout
+FRAME_FORMAT = "RGBX"
+POLL = 0.1  # seconds between checks that the worker being waited on is still alive
+
+
+class WorkerError(RuntimeError):
+    """A render worker failed; the message is its traceback, or how it exited."""
+
+
+class FrameRing:
+    """depth frames of size (w, h) back to back in one shared memory block."""
+
+    def __init__(self, size, depth, name=None):
+        self.size = size
+        self.depth = depth
+        self.frame_bytes = size[0] * size[1] * 4
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=self.frame_bytes * depth)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.owner = name is None
+        self.views = [self.shm.buf[i * self.frame_bytes:(i + 1) * self.frame_bytes] for i in range(depth)]
+        self.surfaces = [pygame.image.frombuffer(view, size, FRAME_FORMAT) for view in self.views]
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        # Surfaces and views export the block's buffer, which must be let go before it can close
+        self.surfaces.clear()
+        views, self.views = self.views, []
+        try:
+            for view in views:
+                try:
+                    view.release()
+                except BufferError:
+                    pass  # a surface over it is still referenced elsewhere
+            self.shm.close()
+        except BufferError:
+            pass  # e.g. a traceback still holds a frame; the mapping goes with the last reference
+        finally:
+            if self.owner:
+                self.shm.unlink()
+
+
+def render_scene(main, ring, frame, petal_field, job, scene, lod, commands, ready, free):
+    """Render one scene's frames into free slots; False if told to shut down meanwhile."""
+    pattern = main.build_scene(scene)
+    pattern.set_lod(lod)
+    scene_duration = getattr(pattern, 'duration', main.FPS * 10)
+
+    for frame_count in range(scene_duration):
+        slot = None
+        while slot is None:
+            try:
+                command = commands.get_nowait()
+                if command is None:
+                    return False
+                if command[0] == "stop":
+                    return True
+                if command[0] == "lod":
+                    pattern.set_lod(command[1])
+            except queue.Empty:
+                pass
+            try:
+                slot = free.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        start = time.perf_counter()
+        main.render_frame(frame, petal_field, pattern, frame_count, scene_duration)
+        ring.surfaces[slot].blit(frame, (0, 0))
+        ready.put((job, slot, (time.perf_counter() - start) * 1000))
+    return True
+
+
+def worker(size, ring_name, depth, audio_reactive, commands, ready, free):
+    """Worker process body: render each ("scene", job, name, seed, lod, overlay_steps) it is sent until None.
+
+    overlay_steps is how far to run the overlay before the worker's first scene.
+    While rendering it also takes ("lod", level) and ("stop",) from commands.
+    """
+    import main
+    import stage
+    stage.init_display(headless=True, size=size)
+    stage.audio.enabled = audio_reactive
+    ring = FrameRing(size, depth, ring_name)
+    try:
+        frame = pygame.Surface(size)
+        petal_field = None
+        running = True
+        while running:
+            command = commands.get()
+            if command is None:
+                break
+            if command[0] != "scene":
+                continue  # lod/stop meant for a scene that already finished
+            _, job, scene, seed, lod, overlay_steps = command
+            random.seed(seed)
+            if petal_field is None:  # made after seeding, so --seed reproduces it
+                petal_field = main.PetalField()
+                for _ in range(overlay_steps):
+                    petal_field.update()
+            try:
+                running = render_scene(main, ring, frame, petal_field, job, scene, lod, commands, ready, free)
+            except Exception:
+                # Posted in place of a frame, so the display raises instead of waiting forever
+                ready.put((job, None, traceback.format_exc()))
+                raise
+    finally:
+        ring.close()
+
+
+class RenderPool:
+    """Worker processes rendering the playlist ahead of the display.
+
+    playlist is the scene names in order; workers import each scene's module
+    the first time they are given it.  lineup holds [worker, job, scene_index]
+    for the scene on screen first, then the scenes after it, one per worker.
+    """
+
+    def __init__(self, size, playlist, workers=2, depth=4, audio_reactive=False):
+        ctx = mp.get_context("spawn")  # never fork a process that already has a display
+        self.playlist = list(playlist)
+        self.scene_count = len(self.playlist)
+        self.rings = []
+        self.commands = []
+        self.ready = []
+        self.free = []
+        self.processes = []
+        for _ in range(workers):
+            ring = FrameRing(size, depth)
+            commands, ready, free = ctx.Queue(), ctx.Queue(), ctx.Queue()
+            for slot in range(depth):
+                free.put(slot)
+            process = ctx.Process(target=worker, args=(size, ring.name, depth, audio_reactive, commands, ready, free), daemon=True)
+            process.start()
+            self.rings.append(ring)
+            self.commands.append(commands)
+            self.ready.append(ready)
+            self.free.append(free)
+            self.processes.append(process)
+        self.lineup = deque()
+        self.jobs = 0
+        self.held = None  # (worker, slot) on screen, returned once the next frame is in
+
+    def start(self, scene_index, level_for=lambda scene_index: 1.0, duration_for=lambda scene_index: 0):
+        """Queue scene_index and the scenes after it, one per worker.
+
+        duration_for gives a scene's length in steps, for how long the overlay
+        has been falling by the time each of these scenes comes on.
+        """
+        self.level_for = level_for
+        steps = 0
+        for w in range(len(self.processes)):
+            index = (scene_index + w) % self.scene_count
+            self.assign(w, index, steps)
+            steps += duration_for(index)
+
+    def assign(self, w, scene_index, overlay_steps=0):
+        self.jobs += 1
+        self.commands[w].put(("scene", self.jobs, self.playlist[scene_index], random.getrandbits(32),
+                              self.level_for(scene_index), overlay_steps))
+        self.lineup.append([w, self.jobs, scene_index])
+
+    @property
+    def scene_index(self):
+        return self.lineup[0][2]
+
+    def next_frame(self):
+        """(surface, render ms) of the current scene's next frame, waiting for it if needed."""
+        w, job, _ = self.lineup[0]
+        while True:
+            frame_job, slot, ms = self.receive(w)
+            if frame_job == job:
+                break
+            self.free[w].put(slot)  # left over from a skipped scene
+        self.release()
+        self.held = (w, slot)
+        return self.rings[w].surfaces[slot], ms
+
+    def receive(self, w):
+        """The next (job, slot, render ms) posted by worker w; WorkerError if it failed or died."""
+        while True:
+            try:
+                job, slot, ms = self.ready[w].get(timeout=POLL)
+            except queue.Empty:
+                process = self.processes[w]
+                if not process.is_alive():
+                    raise WorkerError(f"render worker {w} exited with code {process.exitcode}") from None
+                pygame.event.pump()  # a slow scene start mustn't make the window stop responding
+                continue
+            if slot is None:
+                raise WorkerError(ms)
+            return job, slot, ms
+
+    def release(self):
+        if self.held:
+            w, slot = self.held
+            self.free[w].put(slot)
+            self.held = None
+
+    def set_lod(self, level):
+        self.commands[self.lineup[0][0]].put(("lod", level))
+
+    def advance(self, skip=False):
+        """Move on to the next scene; the freed worker starts on the one after the lineup.
+
+        skip stops the current scene's worker mid-scene instead of letting it finish.
+        """
+        self.release()
+        after = (self.lineup[-1][2] + 1) % self.scene_count
+        w, _, _ = self.lineup.popleft()
+        if skip:
+            self.commands[w].put(("stop",))
+            self.drain(w)
+        self.assign(w, after)
+        return self.scene_index
+
+    def drain(self, w):
+        """Hand back the slots of frames w has finished but nobody will show."""
+        while True:
+            try:
+                _, slot, _ = self.ready[w].get_nowait()
+            except queue.Empty:
+                return
+            if slot is not None:  # None: w failed, and receive() will find it dead
+                self.free[w].put(slot)
+
+    def close(self):
+        # Every ring is closed even if stopping a worker or closing another ring fails
+        with ExitStack() as stack:
+            for ring in self.rings:
+                stack.callback(ring.close)
+            for commands in self.commands:
+                commands.put(None)
+            for process in self.processes:
+                process.join(timeout=2)
+                if process.is_alive():
+                    process.terminate()
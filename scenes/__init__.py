@@ -0,0 +1,58 @@
+"""Scene plugins, imported the first time a playlist reaches them.
+
+Each scene lives in its own module under scenes/.  REGISTRY maps a scene's
+class name to that module, so building a playlist or looking a scene up costs
+nothing until the scene is actually shown.  Scenes kept elsewhere (another
+package, a local experiment) join with register().
+"""
+import importlib
+
+REGISTRY = {
+    "ButterflyScene": "scenes.butterfly",
+    "ButterflySwarmScene": "scenes.butterfly",
+    "PainterlyMandalaField": "scenes.mandala",
+    "BrushStreakBurst": "scenes.brush_streaks",
+    "SoftLayeredBloom": "scenes.soft_bloom",
+    "ExpressiveSwirlBloom": "scenes.swirl",
+    "GalaxySwirlBloom": "scenes.galaxy",
+    "PetalDriftVortexScene": "scenes.vortex",
+    "PainterlyFlowerField": "scenes.painterly_flowers",
+    "FractalSpiralBloom": "scenes.fractal_spiral",
+    "MultiRosePattern": "scenes.rose",
+    "PhyllotaxisPattern": "scenes.phyllotaxis",
+    "MultiPhyllotaxisBursts": "scenes.phyllotaxis",
+    "MultiLissajousPattern": "scenes.lissajous",
+    "MultiLSystemPattern": "scenes.lsystem",
+    "RotatingFlowerField": "scenes.rotating_flowers",
+}
+
+# The show's default running order
+PLAYLIST = [
+    "ButterflyScene",
+    "PainterlyMandalaField",
+    "BrushStreakBurst",
+    "ExpressiveSwirlBloom",
+    "GalaxySwirlBloom",
+    "PetalDriftVortexScene",
+    "PainterlyFlowerField",
+    "FractalSpiralBloom",
+    "MultiRosePattern",
+    "MultiPhyllotaxisBursts",
+    "RotatingFlowerField",
+    "MultiLissajousPattern",
+    "MultiLSystemPattern",
+]
+
+
+def register(name, module):
+    """Make the class called name in module (a dotted import path) available as a scene."""
+    REGISTRY[name] = module
+
+
+def load(name):
+    """The scene class registered as name, importing its module on first use."""
+    try:
+        module = REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"Unknown scene {name!r}. Choose from: " + ", ".join(REGISTRY)) from None
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,36 @@
+from audio_analysis import QUIET
+from stage import FPS
+
+
+# --- Pattern base with optional duration and music ---
+class Pattern:
+    duration = FPS * 15  # default
+    music_file = None
+    lod = 1.0  # level of detail, lowered by the LOD governor on slow machines
+    # Dirty-rect support: draw_backdrop() paints what stays put, draw_dirty() the
+    # rest, returning the rects it touched
+    dirty_rects = False
+    hides_petals = False  # backdrop is opaque, so the petal overlay never shows
+    # Audio-reactive mode: the music's analyzed levels, and `sound`, their value at
+    # the current step, which scenes scale speeds, spawn rates and hues by
+    envelope = None
+    sound = QUIET
+    heard = 0
+    def listen(self):
+        """Move `sound` on to the next simulation step of the music (QUIET without an envelope)."""
+        if self.envelope is not None:
+            self.sound = self.envelope[self.heard]
+            self.heard += 1
+    def update(self):
+        pass
+    def draw(self, surface):
+        pass
+    def draw_backdrop(self, surface):
+        surface.fill((10, 10, 30))
+    def draw_dirty(self, surface):
+        return []
+    def set_lod(self, level):
+        self.lod = level
+    def scaled(self, n, minimum=1):
+        """A density (sample count, spawn rate, ...) at the current level of detail."""
+        return max(minimum, int(n * self.lod))
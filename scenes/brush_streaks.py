@@ -0,0 +1,63 @@
+import math
+import random
+
+import numpy as np
+import pygame
+
+import stage
+from palette import hues_to_rgb
+from particles import ParticleSystem
+from scenes.base import Pattern
+from stage import FPS
+
+
+class BrushStreakBurst(Pattern):
+    name = "BrushStreakBurst"
+    duration = FPS * 20
+    dirty_rects = True
+    music_file = "assets/Jahzzar - Change.mp3"
+    max_streaks = 200
+    spawn_rate = 3  # streaks per frame while under max_streaks
+
+    def __init__(self):
+        # Seeded from `random` so --seed still reproduces the scene
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self.streaks = ParticleSystem(
+            self.max_streaks + self.spawn_rate,
+            x=np.float64, y=np.float64, end_x=np.float64, end_y=np.float64,
+            width=np.int32, hue=np.int32, alpha=np.float64, fade_speed=np.float64,
+        )
+
+    def spawn(self, n):
+        rng = self.rng
+        x = rng.integers(150, stage.WIDTH - 150, n, endpoint=True)
+        y = rng.integers(150, stage.HEIGHT - 150, n, endpoint=True)
+        angle = rng.uniform(0, 2 * math.pi, n)
+        length = rng.integers(80, 160, n, endpoint=True)
+        self.streaks.spawn(
+            n, x=x, y=y,
+            end_x=x + np.cos(angle) * length,
+            end_y=y + np.sin(angle) * length,
+            width=rng.integers(6, 12, n, endpoint=True),
+            hue=rng.integers(0, 360, n, endpoint=True),
+            alpha=255,
+            fade_speed=rng.uniform(0.3, 1.0, n),
+        )
+
+    def update(self):
+        s = self.streaks
+        if len(s) < self.scaled(self.max_streaks):
+            self.spawn(self.spawn_rate + round(4 * self.sound.onset))
+        s.alpha -= s.fade_speed
+        s.cull(s.alpha > 0)
+
+    def draw_dirty(self, surface):
+        s = self.streaks
+        line = pygame.draw.line
+        colors = hues_to_rgb(s.hue, 70, 100).tolist()
+        return [line(surface, color, (x, y), (end_x, end_y), width)
+                for x, y, end_x, end_y, width, color in zip(s.x.tolist(), s.y.tolist(), s.end_x.tolist(),
+                                                            s.end_y.tolist(), s.width.tolist(), colors)]
+
+    def draw(self, surface):
+        self.draw_dirty(surface)
@@ -0,0 +1,130 @@
+import math
+import os
+import random
+
+import numpy as np
+import pygame
+
+import stage
+from flocking import Flock
+from scenes.base import Pattern
+from stage import FPS, assets, sprites, ticks
+
+
+class ButterflyScene(Pattern):
+    name = "ButterflyScene"
+    duration = FPS * 20
+    dirty_rects = True
+    hides_petals = True
+    music_file = "assets/JBlanked_Bastardboy Production - Feel It.mp3"
+    butterfly_count = 14
+
+    def __init__(self):
+        self.load_assets()
+        self.butterflies = [self.Butterfly(self.butterfly_image) for _ in range(self.butterfly_count)]
+        # Wings only swing between -20 and 20 degrees, so the whole flap at every size
+        # butterflies come in is baked into a bank once and mapped from disk after that
+        flap = range(-20, 21, 2)
+        scales = [scale / 10 for scale in range(10, 17)]
+        sprites.prebake("butterfly", flap, scales, scale_step=0.1, bank="butterfly", params=self.image_mtime)
+        sprites.prebake("butterfly_glow", flap, scales, self.Butterfly.bake_glow, scale_step=0.1, bank="butterfly_glow")
+
+    def load_assets(self):
+        """The dimmed floral backdrop, and the butterfly image as the atlas's "butterfly" base."""
+        background = assets.image("assets/floral.png", size=(stage.WIDTH, stage.HEIGHT))
+        # Dim overlay baked in once: BACKGROUND_ALPHA = 80 → 255-80 = 175
+        self.background = stage.compositor.fuse("butterfly.backdrop", background, ((0, 0, 0), 175, "normal"))
+        self.butterfly_image = assets.image("assets/butterfly.png", alpha=True)
+        sprites.set_base("butterfly", self.butterfly_image)
+        self.image_mtime = os.stat("assets/butterfly.png").st_mtime_ns  # banks built from it go stale with it
+
+    class Butterfly:
+        def __init__(self, image):
+            self.image = image
+            self.x = random.uniform(0, stage.WIDTH)
+            self.y = random.uniform(0, stage.HEIGHT)
+            self.vx = random.uniform(-1.5, 1.5)
+            self.vy = random.uniform(-1.0, 1.0)
+            self.wing_angle = 0
+            self.wing_speed = random.uniform(0.15, 0.25)
+            self.scale = random.uniform(1.0, 1.6)
+
+        def update(self):
+            self.x += self.vx
+            self.y += self.vy
+            self.wing_angle = math.sin(ticks() * self.wing_speed * 0.01) * 20
+            if self.x < 0 or self.x > stage.WIDTH: self.vx *= -1
+            if self.y < 0 or self.y > stage.HEIGHT: self.vy *= -1
+
+        @staticmethod
+        def bake_glow():
+            glow = pygame.Surface((100, 80), pygame.SRCALPHA)
+            pygame.draw.ellipse(glow, (255, 255, 255, 25), (20, 30, 60, 30))
+            return glow
+
+        def draw(self, surface):
+            # Drawn part way to the next step when frames come faster than the simulation
+            center = (int(self.x + self.vx * stage.interpolation), int(self.y + self.vy * stage.interpolation))
+            glow = sprites.get("butterfly_glow", self.wing_angle, self.scale, self.bake_glow, scale_step=0.1)
+            glow_rect = glow.get_rect(center=center)
+            surface.blit(glow, glow_rect)
+
+            rotated = sprites.get("butterfly", self.wing_angle, self.scale, scale_step=0.1)
+            rect = rotated.get_rect(center=center)
+            return surface.blit(rotated, rect).union(glow_rect)
+
+    def update(self):
+        for b in self.butterflies[:self.scaled(self.butterfly_count)]:
+            b.update()
+
+    def draw_backdrop(self, surface):
+        surface.blit(self.background, (0, 0))
+
+    def draw_dirty(self, surface):
+        return [b.draw(surface) for b in self.butterflies[:self.scaled(self.butterfly_count)]]
+
+    def draw(self, surface):
+        self.draw_backdrop(surface)
+        self.draw_dirty(surface)
+
+
+class ButterflySwarmScene(ButterflyScene):
+    """Thousands of small butterflies flocking as boids over the same backdrop."""
+    name = "ButterflySwarmScene"
+    butterfly_count = 3000
+    scales = (0.08, 0.1, 0.12, 0.14)  # sprite scales, one per butterfly at random
+
+    def __init__(self):
+        self.load_assets()
+        # One sprite per (scale, heading) from a bank; a wingbeat only nudges which heading is drawn
+        angles = [step * sprites.angle_step for step in range(round(360 / sprites.angle_step))]
+        sprites.prebake("butterfly", angles, self.scales, scale_step=0.02, bank="butterfly_swarm",
+                        params=self.image_mtime)
+        self.frames = [sprites.get("butterfly", angle, scale, scale_step=0.02)
+                       for scale in self.scales for angle in angles]
+        self.half_w = np.array([f.get_width() // 2 for f in self.frames])
+        self.half_h = np.array([f.get_height() // 2 for f in self.frames])
+
+        rng = np.random.default_rng(random.getrandbits(64))  # seeded from `random` for --seed
+        self.flock = Flock(self.butterfly_count, (stage.WIDTH, stage.HEIGHT), rng, radius=30, separation=10)
+        self.size_index = rng.integers(0, len(self.scales), self.butterfly_count) * len(angles)
+        self.wing_speed = rng.uniform(0.15, 0.25, self.butterfly_count)
+        self.wing_phase = rng.uniform(0, 2 * math.pi, self.butterfly_count)
+
+    def update(self):
+        # Bass lets the swarm fly faster in audio-reactive mode.  Like ButterflyScene,
+        # only the butterflies drawn at the current level of detail are simulated
+        self.flock.step(1 + self.sound.bass, self.scaled(self.butterfly_count))
+
+    def draw_dirty(self, surface):
+        n = self.scaled(self.butterfly_count)
+        vel = self.flock.vel[:n]
+        pos = self.flock.pos[:n] + vel * stage.interpolation
+        # The image faces up; pygame rotates counterclockwise with y pointing down
+        heading = -np.degrees(np.arctan2(vel[:, 1], vel[:, 0])) - 90
+        flap = np.sin(ticks() * self.wing_speed[:n] * 0.01 + self.wing_phase[:n]) * 20
+        steps = round(360 / sprites.angle_step)
+        index = self.size_index[:n] + np.rint((heading + flap) / sprites.angle_step).astype(np.int64) % steps
+        x = (pos[:, 0] - self.half_w[index]).astype(np.int32).tolist()
+        y = (pos[:, 1] - self.half_h[index]).astype(np.int32).tolist()
+        return surface.blits(zip(map(self.frames.__getitem__, index.tolist()), zip(x, y)))
@@ -0,0 +1,94 @@
+import math
+
+import pygame
+
+import stage
+from palette import HUE_STEPS, hsv_color
+from scenes.base import Pattern
+from sprite_bank import SpriteBank, fingerprint
+from stage import FPS
+
+SCALE_STEPS = 100  # stamp scales are kept in hundredths
+
+
+def flower_reach(depth, scale):
+    """How far a flower's outermost petal reaches from its centre."""
+    if depth == 1:
+        return 15 * scale
+    return 10 * scale + flower_reach(depth - 1, scale * 0.8)
+
+
+def draw_petals(surface, x, y, hue, angle, depth, scale):
+    if depth == 0:
+        return
+    color = hsv_color(hue * 360 % 360, 70)
+    for i in range(6):
+        a = math.radians(i * 60 + angle)
+        dx = math.cos(a) * 10 * scale
+        dy = math.sin(a) * 10 * scale
+        pygame.draw.ellipse(surface, color, (x + dx - 5 * scale, y + dy - 5 * scale, 10 * scale, 10 * scale))
+        draw_petals(surface, x + dx, y + dy, hue + 0.02, angle + 10, depth - 1, scale * 0.8)
+
+
+def render_flower(hue, angle, depth, scale):
+    """Stamp of the recursive flower for a hue step, petal angle (degrees), depth and scale in hundredths."""
+    s = scale / SCALE_STEPS
+    reach = math.ceil(flower_reach(depth, s)) + 1
+    stamp = pygame.Surface((reach * 2, reach * 2), pygame.SRCALPHA)
+    draw_petals(stamp, reach, reach, hue / HUE_STEPS, angle, depth, s)
+    return stamp
+
+
+# --- FractalSpiralBloom pattern ---
+class FractalSpiralBloom(Pattern):
+    name = "FractalSpiralBloom"
+    duration = FPS * 15
+    music_file = "assets/Il Sogno Del Marinaio - Partisian Song.mp3"
+    max_flowers = 600  # enough to reach the corners of the screen
+    per_frame = 4  # Add multiple per frame for richer fill
+    depth = 3  # a fourth level fills the petals in solid
+
+    def __init__(self):
+        self.flowers = []
+        self.angle_offset = 137.5
+        self.scale = 2.5
+        self.frame = 0
+        self.global_rotation = 0
+        self.rotation_speed = 0.002
+        # A flower's hue and angle follow from its index, so every stamp the scene will
+        # need is known up front and kept in a bank that later runs map from disk
+        keys = sorted({self.stamp_key(i, i // self.per_frame) for i in range(self.max_flowers)})
+        self.stamps = SpriteBank("fractal_flowers", keys, render_flower, fingerprint(draw_petals))
+        # Flowers never change once placed, so like PhyllotaxisPattern they accumulate
+        # on a persistent layer and each frame only stamps the ones added since the last
+        self.layer = pygame.Surface((stage.WIDTH, stage.HEIGHT))
+        self.layer.set_colorkey((0, 0, 0))
+        self.drawn = 0
+
+    def stamp_key(self, i, frame):
+        """(hue step, angle, depth, scale) of the stamp for flower i placed on frame.
+
+        The flower is unchanged by a sixth of a turn, so angles share stamps modulo 60.
+        """
+        hue = (i * 0.015 + frame * 0.001) % 1.0
+        return round(hue * HUE_STEPS) % HUE_STEPS, i * 2 % 60, self.depth, SCALE_STEPS
+
+    def update(self):
+        if len(self.flowers) < self.max_flowers:
+            for _ in range(self.per_frame):
+                i = len(self.flowers)
+                theta = math.radians(i * self.angle_offset + self.global_rotation)
+                r = self.scale * math.sqrt(i) * 18
+                x = stage.WIDTH // 2 + r * math.cos(theta)
+                y = stage.HEIGHT // 2 + r * math.sin(theta)
+                stamp = self.stamps[self.stamp_key(i, self.frame)]
+                half = stamp.get_width() // 2
+                self.flowers.append((stamp, (round(x) - half, round(y) - half)))
+        self.frame += 1
+        self.global_rotation += self.rotation_speed
+
+    def draw(self, surface):
+        if self.drawn < len(self.flowers):
+            self.layer.blits(self.flowers[self.drawn:], doreturn=False)
+            self.drawn = len(self.flowers)
+        surface.blit(self.layer, (0, 0))
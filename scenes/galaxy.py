@@ -0,0 +1,69 @@
+import math
+import random
+
+import numpy as np
+import pygame
+
+import stage
+from palette import hsv_color
+from particles import ParticleSystem
+from scenes.base import Pattern
+from stage import FPS
+
+
+class GalaxySwirlBloom(Pattern):
+    name = "GalaxySwirlBloom"
+    duration = FPS * 20
+    music_file = "assets/SalmonLikeTheFish - Glacier.mp3"
+    spawn_rate = 5  # particles per frame; each lives ~320 frames
+    # Drawing costs ~0.4 us a glow (pygame's per-blit overhead), so the pool is capped
+    # where the draw stays near 6 ms of a 60 FPS frame; spawns past it are dropped
+    capacity = 16384
+    hues = (180, 300)  # Bluish-purple range
+    sizes = (2, 3)  # Glow radius in pixels
+
+    def __init__(self):
+        self.center = stage.CENTER
+        # Seeded from `random` so --seed still reproduces the scene
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self.particles = ParticleSystem(
+            self.capacity,
+            angle=np.float64, radius=np.float64, speed=np.float64, angle_speed=np.float64,
+            hue=np.int32, alpha=np.float64, size=np.int32,
+        )
+        # BLEND_ADD ignores per-pixel alpha, so a glow only depends on hue and size.
+        # One small sprite per pair, indexed by (hue - min hue) * len(sizes) + (size - min size)
+        self.glows = [self.bake_glow(hue, size)
+                      for hue in range(self.hues[0], self.hues[1] + 1) for size in self.sizes]
+
+    @staticmethod
+    def bake_glow(hue, size):
+        glow = pygame.Surface((size * 2 + 2, size * 2 + 2))
+        pygame.draw.circle(glow, hsv_color(hue, 80), (size + 1, size + 1), size)
+        return glow
+
+    def update(self):
+        rng = self.rng
+        n = self.scaled(self.spawn_rate) + round(2 * self.spawn_rate * self.sound.onset)
+        ps = self.particles
+        ps.spawn(
+            n,
+            angle=rng.uniform(0, 2 * math.pi, n),
+            speed=rng.uniform(0.5, 1.5, n),
+            angle_speed=rng.uniform(0.01, 0.03, n),
+            hue=rng.integers(self.hues[0], self.hues[1], n, endpoint=True),
+            alpha=255,
+            size=rng.uniform(self.sizes[0], self.sizes[-1] + 1, n),
+        )
+        ps.radius += ps.speed
+        ps.angle += ps.angle_speed
+        ps.alpha -= 0.8
+        ps.cull(ps.alpha > 0)
+
+    def draw(self, surface):
+        ps = self.particles
+        offset = ps.size + 1  # Sprite center to its top-left corner
+        x = (self.center[0] + np.cos(ps.angle) * ps.radius - offset).astype(np.int32)
+        y = (self.center[1] + np.sin(ps.angle) * ps.radius - offset).astype(np.int32)
+        index = (ps.hue - self.hues[0]) * len(self.sizes) + ps.size - self.sizes[0]
+        ps.draw_sprites(surface, self.glows, index, x, y)
@@ -0,0 +1,49 @@
+import math
+import random
+
+import curves
+import stage
+from scenes.base import Pattern
+from stage import FPS
+
+
+# --- MultiLissajousPattern ---
+class MultiLissajousPattern(Pattern):
+    name = "MultiLissajousPattern"
+    duration = FPS * 25
+    music_file = "assets/Squire Tuck - A Mexican Love Affair.mp3"
+    samples = 1000  # points per figure
+
+    def __init__(self):
+        self.figures = [self.create_fig() for _ in range(5)]
+
+    def create_fig(self):
+        return {
+            'a': 10,
+            'b': 10,
+            'max_size': random.uniform(150, 400),
+            'growth_rate': random.uniform(1.2, 2.0),
+            'freq_x': random.randint(2, 5),
+            'freq_y': random.randint(2, 5),
+            'delta': random.uniform(0, math.pi),
+            'delta_speed': random.uniform(0.005, 0.02),
+            'center': (random.randint(0, stage.WIDTH), random.randint(0, stage.HEIGHT)),
+            'hue_offset': random.randint(0, 360)
+        }
+
+    def update(self):
+        for fig in self.figures:
+            fig['a'] += fig['growth_rate']
+            fig['b'] += fig['growth_rate']
+            fig['delta'] += fig['delta_speed']
+            fig['hue_offset'] += 0.5
+        self.figures = [f if f['a'] < f['max_size'] else self.create_fig() for f in self.figures]
+
+    def draw(self, surface):
+        for fig in self.figures:
+            batch = curves.lissajous(fig['freq_x'], fig['freq_y'], fig['a'], fig['b'], fig['delta'],
+                                     fig['center'], fig['hue_offset'], self.scaled(self.samples, 100))
+            curves.draw_dots(surface, batch)
+
+            # Optional glow trail using lines between points
+            curves.draw_trail(surface, batch, 2)
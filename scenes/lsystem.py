@@ -0,0 +1,116 @@
+import math
+import random
+
+import numpy as np
+import pygame
+
+import raster
+import stage
+from palette import hues_to_rgb
+from scenes.base import Pattern
+from stage import FPS
+
+
+# --- MultiLSystemPattern with slow growth and random angles ---
+class MultiLSystemPattern(Pattern):
+    name = "MultiLSystemPattern"
+    duration = FPS * 20
+    music_file = "assets/Circus Marcus - Pompas de Jabón.mp3"
+
+    instance_count = 10  # Was 4
+
+    def __init__(self):
+        self.instances = [self.create_instance() for _ in range(self.instance_count)]
+        self.axiom = "F"
+        self.rules = {"F": "F[+F]F[-F]F"}
+
+    def create_instance(self):
+        return {
+            'gen': 0,
+            'max_gen': random.randint(5, 7),
+            'x': random.randint(100, stage.WIDTH - 100),
+            'y': random.randint(100, stage.HEIGHT - 100),
+            'hue_offset': random.randint(0, 360),
+            'current_string': "F",
+            'angle': random.randint(20, 45),  # Slightly wider angle range
+            'growth_timer': 0,
+            'growth_delay': random.randint(20, 50),  # Faster growth
+            'sprite': None,  # current generation, rasterized by compile()
+        }
+
+    def apply_rules(self, s):
+        return "".join(self.rules.get(c, c) for c in s)
+
+    def walk(self, inst):
+        """Run the turtle over the current string once: segment endpoints and hues, in draw order."""
+        stack = []
+        x, y = inst['x'], inst['y']
+        turns = 0  # heading is -90 + turns * angle step
+        angle_step = inst['angle']
+        length = 7  # Slightly longer steps
+        steps = {}
+        segments = []
+        for cmd in inst['current_string']:
+            if cmd == "F":
+                step = steps.get(turns)
+                if step is None:
+                    a = math.radians(-90 + turns * angle_step)
+                    step = steps[turns] = (math.cos(a) * length, math.sin(a) * length)
+                new_x, new_y = x + step[0], y + step[1]
+                segments.append((x, y, new_x, new_y))
+                x, y = new_x, new_y
+            elif cmd == "+":
+                turns += 1
+            elif cmd == "-":
+                turns -= 1
+            elif cmd == "[":
+                stack.append((x, y, turns))
+            elif cmd == "]":
+                x, y, turns = stack.pop()
+        segments = np.array(segments)
+        hues = (inst['hue_offset'] + 0.5 * np.arange(len(segments))) % 360
+        return segments, hues
+
+    def compile(self, inst):
+        """Rasterize a generation onto a sprite covering the on-screen part of its bounding box.
+
+        Generations only change every growth_delay frames, so every other frame is a single blit.
+        Late generations reach far off screen, so segments entirely outside it are dropped first.
+        """
+        segments, hues = self.walk(inst)
+        pad = 3  # Line width
+        x0, y0, x1, y1 = segments.T
+        on = ((np.maximum(x0, x1) >= -pad) & (np.minimum(x0, x1) < stage.WIDTH + pad)
+              & (np.maximum(y0, y1) >= -pad) & (np.minimum(y0, y1) < stage.HEIGHT + pad))
+        segments, hues = segments[on], hues[on]
+        if not len(segments):
+            inst['sprite'] = pygame.Surface((0, 0))
+            inst['sprite_pos'] = (0, 0)
+            return
+        left = max(0, int(min(segments[:, 0].min(), segments[:, 2].min())) - pad)
+        top = max(0, int(min(segments[:, 1].min(), segments[:, 3].min())) - pad)
+        right = min(stage.WIDTH, int(max(segments[:, 0].max(), segments[:, 2].max())) + pad)
+        bottom = min(stage.HEIGHT, int(max(segments[:, 1].max(), segments[:, 3].max())) + pad)
+        sprite = pygame.Surface((right - left, bottom - top))
+        sprite.set_colorkey((0, 0, 0))
+        local = np.rint(segments - (left, top, left, top)).astype(np.int32)
+        raster.draw_segments(sprite, *local.T, hues_to_rgb(hues, 100, 100), 3)  # Thicker lines (was 2)
+        inst['sprite'] = sprite
+        inst['sprite_pos'] = (left, top)
+
+    def update(self):
+        for inst in self.instances:
+            inst['growth_timer'] += 1
+            if inst['growth_timer'] >= inst['growth_delay'] and inst['gen'] < inst['max_gen']:
+                inst['current_string'] = self.apply_rules(inst['current_string'])
+                inst['gen'] += 1
+                inst['growth_timer'] = 0
+                inst['sprite'] = None
+            elif inst['gen'] >= inst['max_gen']:
+                inst.update(self.create_instance())
+
+    def draw(self, surface):
+        for inst in self.instances[:self.scaled(self.instance_count)]:
+            if inst['sprite'] is None:
+                self.compile(inst)
+            surface.blit(inst['sprite'], inst['sprite_pos'])
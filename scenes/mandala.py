@@ -0,0 +1,65 @@
+import math
+import random
+
+import stage
+from petal_textures import MANDALA_PETAL
+from scenes.base import Pattern
+from stage import FPS, petal_textures
+
+
+class PainterlyMandalaField(Pattern):
+    name = "PainterlyMandalaField"
+    duration = FPS * 20
+    music_file = "assets/SalmonLikeTheFish - Zion.mp3"
+
+    class Ring:
+        def __init__(self, center, layers=4):
+            self.center = center
+            self.layers = layers
+            self.hue_base = random.randint(0, 360)
+            self.rotation = 0
+            self.rotation_speed = random.uniform(-0.01, 0.01)
+            self.scale = 0.1
+            self.growth_rate = random.uniform(0.002, 0.006)
+            self.max_scale = random.uniform(0.9, 1.5)
+            self.angle_offsets = [random.uniform(0, 2 * math.pi) for _ in range(layers)]
+
+        def update(self, sound):
+            # Bass spins the petals faster, onsets push a growth spurt
+            self.rotation += self.rotation_speed * (1 + 3 * sound.bass)
+            if self.scale < self.max_scale:
+                self.scale += self.growth_rate * (1 + 2 * sound.onset)
+
+        def draw(self, surface, profile=MANDALA_PETAL):
+            for layer in range(self.layers):
+                petals = 6 + layer * 2
+                radius = 40 + 25 * layer
+                hue = (self.hue_base + layer * 20) % 360
+                phase = self.rotation + self.angle_offsets[layer]
+                petal_textures.draw_ring(surface, self.center, radius, petals, phase,
+                                         hue, 60, profile, self.scale)
+
+    def __init__(self):
+        self.reset()
+        self.age = 0
+        self.reset_interval = FPS * 5  # 5 seconds
+
+    def reset(self):
+        self.rings = [self.Ring(
+            (random.randint(150, stage.WIDTH - 150), random.randint(150, stage.HEIGHT - 150)),
+            layers=random.randint(3, 5)
+        ) for _ in range(8)]
+
+    def update(self):
+        self.age += 1
+        if self.age >= self.reset_interval:
+            self.reset()
+            self.age = 0
+        for r in self.rings:
+            r.update(self.sound)
+
+    def draw(self, surface):
+        # Fewer gradient steps at low detail: new textures, but each one is cheaper to bake
+        profile = MANDALA_PETAL._replace(steps=self.scaled(MANDALA_PETAL.steps, 3))
+        for r in self.rings:
+            r.draw(surface, profile)
@@ -0,0 +1,66 @@
+import math
+import random
+
+import stage
+from petal_textures import FLOWER_PETAL
+from scenes.base import Pattern
+from stage import FPS, petal_textures
+
+
+# --- PainterlyFlowerField (multiple flowers) ---
+class PainterlyFlowerField(Pattern):
+    name = "PainterlyFlowerField"
+    duration = FPS * 15
+    music_file = "assets/Squire Tuck - Dreams Like These.mp3"
+
+    class Flower:
+        def __init__(self, center, layers=3):
+            self.center = center
+            self.layers = layers
+            self.angle_offsets = [random.uniform(0, 2 * math.pi) for _ in range(layers)]
+            self.hue_base = random.randint(0, 360)
+            self.rotation = 0
+            self.rotation_speed = random.uniform(-0.006, 0.006)
+            self.scale = 0.1
+            self.growth_rate = 0.01  # Faster growth
+            self.max_scale = 1.6
+
+        def update(self, sound):
+            # Bass spins the petals faster, onsets push a growth spurt
+            self.rotation += self.rotation_speed * (1 + 3 * sound.bass)
+            if self.scale < self.max_scale:
+                self.scale += self.growth_rate * (1 + 2 * sound.onset)
+
+        def draw(self, surface, profile=FLOWER_PETAL):
+            for layer in range(self.layers):
+                petals = 5 + layer * 2
+                radius = 35 + 20 * layer
+                hue = (self.hue_base + layer * 30) % 360
+                phase = self.rotation + self.angle_offsets[layer]
+                petal_textures.draw_ring(surface, self.center, radius, petals, phase,
+                                         hue, 50 + layer * 12, profile, self.scale)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.flowers = [self.Flower((random.randint(150, stage.WIDTH - 150), random.randint(150, stage.HEIGHT - 150)),
+                                    layers=random.randint(2, 4)) for _ in range(6)]
+        self.age = 0
+        self.flash_alpha = 255
+
+    def update(self):
+        self.age += 1
+        if self.age > FPS * 6:
+            self.reset()
+        else:
+            for flower in self.flowers:
+                flower.update(self.sound)
+
+    def draw(self, surface):
+        profile = FLOWER_PETAL._replace(steps=self.scaled(FLOWER_PETAL.steps, 3))
+        for flower in self.flowers:
+            flower.draw(surface, profile)
+        if self.flash_alpha > 0:
+            stage.compositor.wash(surface, (255, 255, 255), int(self.flash_alpha))
+            self.flash_alpha -= 20
@@ -0,0 +1,59 @@
+import math
+import random
+
+import pygame
+
+import stage
+from palette import hsv_color
+from stage import sprites
+
+
+# --- PetalField overlay ---
+class Petal:
+    name = "Petal"
+    def __init__(self):
+        self.x = random.randint(0, stage.WIDTH)
+        self.y = random.randint(-100, -40)
+        self.size = random.uniform(10, 20)
+        self.growth = random.uniform(0.01, 0.05)
+        self.rotation = random.uniform(0, 2 * math.pi)
+        self.rotation_speed = random.uniform(-0.01, 0.01)
+        self.fall_speed = random.uniform(0.5, 1.5)
+        self.hue = random.randint(300, 360)
+        self.alpha = 255
+
+    def update(self):
+        self.y += self.fall_speed
+        self.rotation += self.rotation_speed
+        self.size += self.growth
+        self.alpha = max(0, self.alpha - 0.3)
+        return self.y <= stage.HEIGHT and self.alpha > 0
+
+    @staticmethod
+    def bake(hue):
+        petal_surface = pygame.Surface((40, 40), pygame.SRCALPHA)
+        color = hsv_color(hue % 360, 60)
+        pygame.draw.ellipse(petal_surface, color, (10, 0, 20, 40))
+        return petal_surface
+
+    def draw(self, surface):
+        hue = self.hue % 360
+        rotated = sprites.get(("petal", hue), math.degrees(self.rotation), self.size / 20, self.bake, hue)
+        # Baked opaque; the fade is applied per blit since the sprite is shared
+        rotated.set_alpha(int(self.alpha))
+        rect = rotated.get_rect(center=(int(self.x), int(self.y + self.fall_speed * stage.interpolation)))
+        return surface.blit(rotated, rect)
+
+
+class PetalField:
+    def __init__(self):
+        self.petals = [Petal() for _ in range(30)]
+
+    def update(self):
+        self.petals = [p for p in self.petals if p.update()]
+        while len(self.petals) < 30:
+            self.petals.append(Petal())
+
+    def draw(self, surface):
+        """Returns the rects the petals were drawn into."""
+        return [p.draw(surface) for p in self.petals]
@@ -0,0 +1,121 @@
+import math
+import random
+
+import numpy as np
+import pygame
+
+import curves
+import stage
+from palette import hues_to_rgb
+from scenes.base import Pattern
+from stage import FPS
+
+
+# --- PhyllotaxisPattern ---
+class PhyllotaxisPattern(Pattern):
+    name = "PhyllotaxisPattern"
+    duration = FPS * 15
+    music_file = "assets/Squire Tuck - Squire Tuck - Irrational Fear of Fearing Nothing at all.mp3"
+
+    def __init__(self):
+        self.n = 0
+        self.c = random.uniform(2.5, 6.0)  # Tighter spacing for density
+        self.hue_offset = random.randint(0, 360)
+        self.noise = np.array([random.uniform(-2, 2) for _ in range(20000)])  # More jitter
+
+        # Points never move once placed, so they accumulate on a persistent layer
+        # and each frame only rasterizes the ones added since the last draw
+        self.layer = pygame.Surface((stage.WIDTH, stage.HEIGHT))
+        self.layer.set_colorkey((0, 0, 0))
+        self.drawn = 0
+
+    def update(self):
+        self.n += 30  # Faster growth rate
+
+    def points(self, start, stop):
+        i = np.arange(start, stop)
+        noise = self.noise[i % len(self.noise)]
+        angle = i * 137.5 * math.pi / 180 + noise * 0.015
+        r = self.c * np.sqrt(i) + noise * 1.5
+        sx = (stage.CENTER[0] + r * np.cos(angle)).astype(np.int32)
+        sy = (stage.CENTER[1] + r * np.sin(angle)).astype(np.int32)
+        hue = (i * 0.8 + self.hue_offset + noise * 5) % 360
+        radius = np.where(i % 3, 2, 3)  # Slight variation in size
+        return curves.CurveBatch(sx, sy, hues_to_rgb(hue, 80, 100), radius)
+
+    def draw(self, surface):
+        if self.drawn < self.n:
+            curves.draw_dots(self.layer, self.points(self.drawn, self.n))
+            self.drawn = self.n
+        surface.blit(self.layer, (0, 0))
+
+# Index 0 of a burst layer is transparent; the rest split the hue circle
+LAYER_HUES = 255
+
+
+class MultiPhyllotaxisBursts(Pattern):
+    name = "PhyllotaxisBursts"
+    duration = FPS * 20  # Optionally adjust to match longer music
+    music_file = "assets/Squire Tuck - Squire Tuck - Irrational Fear of Fearing Nothing at all.mp3"
+
+    class Burst:
+        def __init__(self):
+            self.center = (random.randint(50, stage.WIDTH - 50), random.randint(50, stage.HEIGHT - 50))
+            self.c = random.uniform(6, 10)  # Slightly larger spacing
+            self.hue_offset = random.randint(0, 360)
+            self.rotation = random.uniform(0, 2 * math.pi)
+            self.rotation_speed = random.uniform(-0.005, 0.005)  # Slower rotation
+            self.points = []
+            self.max_n = random.randint(1500, 2000)  # More points overall
+            self.age = 0
+            self.drawn = 0
+
+        def update(self):
+            self.rotation += self.rotation_speed
+            self.age += 1
+            if len(self.points) < self.max_n:
+                #for _ in range(random.randint(2, 6)):  # Slower point growth
+                for _ in range(random.randint(1, 3)):  # Even slower growth
+                    i = len(self.points)
+                    angle = i * 137.5 * math.pi / 180 + self.rotation
+                    r = self.c * math.sqrt(i)
+                    jitter = random.uniform(-2, 2)
+                    x = self.center[0] + math.cos(angle) * (r + jitter)
+                    y = self.center[1] + math.sin(angle) * (r + jitter)
+                    hue = (self.hue_offset + i * 0.7) % 360
+                    self.points.append((x, y, hue, i))
+
+        def draw(self, layer):
+            """Stamp the points added since the last draw into layer, as palette indices of their hues."""
+            for x, y, hue, i in self.points[self.drawn:]:
+                size = max(2, int(5 - i / 500))  # Slower shrink over time
+                if 0 <= x < stage.WIDTH and 0 <= y < stage.HEIGHT:
+                    index = 1 + round(hue * LAYER_HUES / 360) % LAYER_HUES
+                    pygame.draw.circle(layer, index, (int(x - size) + size, int(y - size) + size), size)
+            self.drawn = len(self.points)
+
+    burst_count = 14
+
+    def __init__(self):
+        self.bursts = [self.Burst() for _ in range(self.burst_count)]
+        self.hue_shift = 0.0
+        # Points never move and every burst cycles its colors by the same shift, so all
+        # of them live on one 8-bit layer: a frame stamps only the new points, and the
+        # color cycling is a new palette rather than a redraw
+        self.layer = pygame.Surface((stage.WIDTH, stage.HEIGHT), depth=8)
+        self.layer.set_colorkey(0)
+        self.layer.set_alpha(140)  # Keep slightly translucent
+        self.layer_hues = np.arange(LAYER_HUES) * (360 / LAYER_HUES)
+
+    def update(self):
+        self.hue_shift += 0.5 * (1 + 3 * self.sound.high)  # colors cycle faster with the treble
+        for burst in self.bursts:
+            burst.update()
+
+    def draw(self, surface):
+        for burst in self.bursts:
+            burst.draw(self.layer)
+        palette = np.zeros((LAYER_HUES + 1, 3), np.uint8)
+        palette[1:] = hues_to_rgb(self.layer_hues + self.hue_shift)
+        self.layer.set_palette(palette.tolist())
+        surface.blit(self.layer, (0, 0))
@@ -0,0 +1,42 @@
+import random
+
+import curves
+import stage
+from scenes.base import Pattern
+from stage import FPS
+
+
+# --- MultiRosePattern ---
+class MultiRosePattern(Pattern):
+    name = "MultiRosePattern"
+    duration = FPS * 25
+    music_file = "assets/JBlanked - I'm Down (Instrumental).mp3"
+    samples = 800  # points per rose
+
+    def __init__(self):
+        self.roses = [self.create_rose() for _ in range(5)]
+
+    def create_rose(self):
+        return {
+            'k': random.randint(3, 8),
+            'size': 10,
+            'max_size': random.randint(300, 800),
+            'rotation': 0,
+            'rotation_speed': random.uniform(-0.02, 0.02),
+            'center': (random.randint(0, stage.WIDTH), random.randint(0, stage.HEIGHT)),
+            'hue_offset': random.randint(0, 360),
+            'color_speed': random.uniform(0.5, 1.5)
+        }
+
+    def update(self):
+        for rose in self.roses:
+            rose['size'] += 1.2
+            rose['rotation'] += rose['rotation_speed']
+            rose['hue_offset'] += rose['color_speed'] * (1 + 4 * self.sound.high)
+        self.roses = [r if r['size'] < r['max_size'] else self.create_rose() for r in self.roses]
+
+    def draw(self, surface):
+        for rose in self.roses:
+            batch = curves.rose(rose['k'], rose['size'], rose['rotation'], rose['center'],
+                                rose['hue_offset'], rose['color_speed'], self.scaled(self.samples, 100))
+            curves.draw_dots(surface, batch)
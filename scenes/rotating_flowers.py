@@ -0,0 +1,73 @@
+import math
+import random
+
+import pygame
+
+import stage
+from palette import hsv_color
+from scenes.base import Pattern
+from stage import FPS
+
+
+# --- RotatingFlowerField pattern ---
+class RotatingFlowerField(Pattern):
+    name = "RotatingFlowerField"
+    duration = FPS * 15
+    music_file = "assets/SalmonLikeTheFish - Zion.mp3"
+    class Flower:
+        def __init__(self, center, layers=3, petals_per_layer=6):
+            self.center = center
+            self.layers = layers
+            self.petals_per_layer = petals_per_layer
+            self.scale = random.uniform(0.8, 1.4)
+            self.hue_base = random.randint(0, 360)
+            self.rotation = random.uniform(0, 2 * math.pi)
+            self.rotation_speed = random.uniform(-0.002, 0.002)
+
+        def update(self, sound):
+            self.rotation += self.rotation_speed * (1 + 3 * sound.bass)
+
+        def draw(self, surface):
+            for layer in range(self.layers):
+                radius = 20 + layer * 15
+                petals = self.petals_per_layer + layer * 2
+                angle_step = 2 * math.pi / petals
+                color = hsv_color(
+                    (self.hue_base + layer * 20) % 360,
+                    70,
+                    100 - layer * 10,
+                )
+                for i in range(petals):
+                    angle = i * angle_step + self.rotation
+                    x = self.center[0] + math.cos(angle) * radius
+                    y = self.center[1] + math.sin(angle) * radius
+                    petal_surf = pygame.Surface((60, 30), pygame.SRCALPHA)
+                    pygame.draw.ellipse(petal_surf, color, (0, 0, 60, 30))
+                    rotated = pygame.transform.rotozoom(petal_surf, -math.degrees(angle), self.scale)
+                    rect = rotated.get_rect(center=(int(x), int(y)))
+                    surface.blit(rotated, rect)
+
+    def __init__(self):
+        self.flowers = []
+        self.spawn_delay = 30
+        self.timer = 0
+        self.max_flowers = 120
+
+    def update(self):
+        self.timer += 1 + 3 * self.sound.onset  # new flowers come sooner on the beat
+        for flower in self.flowers:
+            flower.update(self.sound)
+        if self.timer >= self.spawn_delay and len(self.flowers) < self.scaled(self.max_flowers):
+            self.add_flower()
+            self.timer = 0
+
+    def add_flower(self):
+        x = random.randint(100, stage.WIDTH - 100)
+        y = random.randint(100, stage.HEIGHT - 100)
+        layers = random.randint(3, 5)
+        petals = random.randint(5, 8)
+        self.flowers.append(self.Flower((x, y), layers, petals))
+
+    def draw(self, surface):
+        for flower in self.flowers:
+            flower.draw(surface)
@@ -0,0 +1,58 @@
+import math
+import random
+
+import pygame
+
+import stage
+from palette import hsv_color
+from scenes.base import Pattern
+from stage import FPS
+
+
+# Took this one out.  Just didn't add much
+class SoftLayeredBloom(Pattern):
+    name = "SoftLayeredBloom"
+    duration = FPS * 20
+    music_file = "assets/The Sluts With Nuts - Mike and Ron Jam.mp3"
+
+    class Bloom:
+        def __init__(self):
+            self.center = (random.randint(150, stage.WIDTH - 150), random.randint(150, stage.HEIGHT - 150))
+            self.layers = random.randint(3, 6)
+            self.rotation = random.uniform(0, 2 * math.pi)
+            self.scale = 0.1
+            self.max_scale = random.uniform(0.8, 1.6)
+            self.growth_rate = random.uniform(0.003, 0.008)
+            self.hue = random.randint(0, 360)
+
+        def update(self):
+            if self.scale < self.max_scale:
+                self.scale += self.growth_rate
+
+        def draw(self, surface):
+            for i in range(self.layers):
+                petals = 6 + i * 2
+                radius = 40 + i * 25
+                for j in range(petals):
+                    angle = 2 * math.pi * j / petals + self.rotation
+                    x = self.center[0] + math.cos(angle) * radius
+                    y = self.center[1] + math.sin(angle) * radius
+                    color = hsv_color((self.hue + i * 15 + j * 5) % 360, 50, 100 - i * 10)
+                    alpha = int(255 * (1 - i / self.layers))
+                    surf = pygame.Surface((30, 60), pygame.SRCALPHA)
+                    pygame.draw.ellipse(surf, color, (0, 0, 30, 60))
+                    surf.set_alpha(alpha)
+                    rotated = pygame.transform.rotozoom(surf, -math.degrees(angle), self.scale)
+                    rect = rotated.get_rect(center=(int(x), int(y)))
+                    surface.blit(rotated, rect)
+
+    def __init__(self):
+        self.blooms = [self.Bloom() for _ in range(10)]
+
+    def update(self):
+        for b in self.blooms:
+            b.update()
+
+    def draw(self, surface):
+        for b in self.blooms:
+            b.draw(surface)
@@ -0,0 +1,44 @@
+import math
+import random
+
+import curves
+import stage
+from scenes.base import Pattern
+from stage import FPS
+
+
+class ExpressiveSwirlBloom(Pattern):
+    name = "ExpressiveSwirlBloom"
+    duration = FPS * 20
+    music_file = "assets/JBlanked - Many Blessings (Instrumental).mp3"
+    samples = 100  # points per swirl
+
+    def __init__(self):
+        self.swirls = [self.create_swirl() for _ in range(6)]
+
+    def create_swirl(self):
+        return {
+            'center': (random.randint(100, stage.WIDTH - 100), random.randint(100, stage.HEIGHT - 100)),
+            'angle': random.uniform(0, 2 * math.pi),
+            'hue': random.randint(0, 360),
+            'radius': 5,
+            'growth': random.uniform(1.2, 2.0),
+            'arms': random.randint(3, 7),
+            'rotation_speed': random.uniform(-0.02, 0.02),
+            'age': 0,
+            'max_age': random.randint(120, 240)
+        }
+
+    def update(self):
+        for swirl in self.swirls:
+            swirl['radius'] += swirl['growth']
+            swirl['angle'] += swirl['rotation_speed']
+            swirl['hue'] = (swirl['hue'] + 0.5) % 360
+            swirl['age'] += 1
+        self.swirls = [s if s['age'] < s['max_age'] else self.create_swirl() for s in self.swirls]
+
+    def draw(self, surface):
+        for swirl in self.swirls:
+            batch = curves.spiral(swirl['arms'], swirl['radius'], swirl['angle'], swirl['center'],
+                                  swirl['hue'], self.scaled(self.samples, 20))
+            curves.draw_dots(surface, batch)
@@ -0,0 +1,86 @@
+import math
+import random
+
+import pygame
+
+import stage
+from palette import hsv_color
+from scenes.base import Pattern
+from stage import FPS, vortex_sprites
+
+
+class VortexPetal:
+    def __init__(self):
+        self.angle = random.uniform(0, 2 * math.pi)
+        self.radius = random.uniform(40, min(stage.WIDTH, stage.HEIGHT) // 2)  # Slightly closer start
+        self.angular_velocity = random.uniform(0.015, 0.035)       # Slightly faster spin
+        self.radial_speed = random.uniform(-0.1, 0.3)              # Some will spiral in
+        self.size = random.uniform(16, 32)                         # Bigger petals
+        self.hue = random.randint(0, 360)
+        # Hue and size never change, so the sprite key is fixed here; 20-degree hues and the
+        # atlas's 0.4 scale steps keep every petal's rotations inside vortex_sprites' budget
+        self.sprite = ("vortex_petal", self.hue // 20 * 20 % 360)
+        self.alpha = 255
+        self.center = (stage.WIDTH // 2, stage.HEIGHT // 2)
+
+    def update(self, sound):
+        self.angle += self.angular_velocity * (1 + 2 * sound.bass)
+        self.radius += self.radial_speed
+        if self.radius < 10 or self.radius > min(stage.WIDTH, stage.HEIGHT) // 1.3:
+            return False
+        return True
+
+    @staticmethod
+    def bake(hue):
+        # Create a surface for the glowing petal
+        petal_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
+
+        # Core color of the petal
+        core_color = hsv_color(hue % 360, 80)
+
+        # Glow edge (stronger saturation, but transparent and expanded)
+        for i in range(3, 0, -1):
+            alpha = 25 * i
+            glow_color = hsv_color(hue % 360, 100, 100, alpha / 2.55)
+            scale = 1.0 + i * 0.2
+            w = int(20 * scale)
+            h = int(40 * scale)
+            offset_x = 30 - w // 2
+            offset_y = 30 - h // 2
+            pygame.draw.ellipse(petal_surface, glow_color, (offset_x, offset_y, w, h))
+
+        # Draw solid center petal on top
+        pygame.draw.ellipse(petal_surface, core_color, (20, 10, 20, 40))
+        return petal_surface
+
+    def draw(self, surface):
+        x = self.center[0] + math.cos(self.angle) * self.radius
+        y = self.center[1] + math.sin(self.angle) * self.radius
+
+        # Rotated and scaled copy comes from the vortex's atlas.  The petal looks the same
+        # turned half way round, so angles share sprites modulo 180 degrees
+        rotated = vortex_sprites.get(self.sprite, math.degrees(self.angle) % 180, self.size / 20,
+                                     self.bake, self.sprite[1])
+        rect = rotated.get_rect(center=(int(x), int(y)))
+        surface.blit(rotated, rect)
+
+
+class PetalDriftVortexScene(Pattern):
+    name = "PetalDriftVortexScene"
+    duration = FPS * 15
+    music_file = "assets/JBlanked - Cobie Sample.mp3"
+    petal_count = 120  # Increased from 80
+
+    def __init__(self):
+        self.petals = [VortexPetal() for _ in range(self.petal_count)]
+
+    def update(self):
+        self.petals = [p for p in self.petals if p.update(self.sound)]
+        target = self.scaled(self.petal_count)
+        del self.petals[target:]
+        while len(self.petals) < target:
+            self.petals.append(VortexPetal())
+
+    def draw(self, surface):
+        for petal in self.petals:
+            petal.draw(surface)
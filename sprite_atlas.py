@@ -0,0 +1,137 @@
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from sprite_bank import SpriteBank, fingerprint
+
+
+# --- Shared cache of pre-rotated / pre-scaled sprites ---
+class SpriteAtlas:
+    """Bakes each base sprite once per quantized (angle, scale) and hands back the result.
+
+    Base sprites are registered under a key, either pinned with set_base or built
+    lazily through a build callable.  Built bases and rotated copies are kept in
+    least-recently-used order and evicted once their pixels exceed budget_mb, so
+    the atlas can't grow without bound when many hues and angles are in play.
+    Sprites prebaked into a SpriteBank are pinned instead: they live in a
+    memory-mapped file, so they neither count against the budget nor get evicted.
+    Safe to share with the scene preloader thread; rotations happen outside the lock.
+    """
+
+    def __init__(self, budget_mb=128, angle_step=2.0, scale_step=0.05):
+        self.budget = budget_mb * 1024 * 1024
+        self.angle_step = angle_step
+        self.scale_step = scale_step
+        self.bases = {}
+        self.baked = OrderedDict()
+        self.pinned = {}  # slot -> sprite from a bank
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def set_base(self, key, surface):
+        with self.lock:
+            if self.bases.get(key) is not surface:
+                self.bases[key] = surface
+                self.drop(key)
+
+    def base(self, key, build=None, *args):
+        with self.lock:
+            surf = self.bases.get(key)
+            if surf is not None:
+                return surf
+            slot = (key,)
+            surf = self.baked.get(slot)
+            if surf is not None:
+                self.baked.move_to_end(slot)
+                return surf
+            if build is None:
+                raise KeyError(f"No base sprite registered for {key!r}")
+            surf = build(*args)
+            self.store(slot, surf)
+            return surf
+
+    def quantize(self, angle, scale, scale_step=None):
+        step = scale_step or self.scale_step
+        a = round(angle / self.angle_step) % round(360 / self.angle_step)
+        s = max(1, round(scale / step))
+        return a, s, step
+
+    def get(self, key, angle, scale, build=None, *args, scale_step=None):
+        """The base sprite for key, rotated by angle degrees and scaled by scale."""
+        a, s, step = self.quantize(angle, scale, scale_step)
+        # The step is part of the slot: scenes sharing a key at different steps
+        # would otherwise get each other's sprites for the same s
+        slot = (key, a, s, step)
+        with self.lock:
+            surf = self.pinned.get(slot)
+            if surf is not None:
+                self.hits += 1
+                return surf
+            surf = self.baked.get(slot)
+            if surf is not None:
+                self.baked.move_to_end(slot)
+                self.hits += 1
+                return surf
+            self.misses += 1
+            base = self.base(key, build, *args)
+
+        surf = pygame.transform.rotozoom(base, a * self.angle_step, s * step)
+        self.store(slot, surf)
+        return surf
+
+    def store(self, slot, surf):
+        with self.lock:
+            old = self.baked.pop(slot, None)
+            if old is not None:
+                self.used -= self.size_of(old)  # baked by both threads at once
+            self.baked[slot] = surf
+            self.used += self.size_of(surf)
+            while self.used > self.budget and len(self.baked) > 1:
+                _, old = self.baked.popitem(last=False)
+                self.used -= self.size_of(old)
+
+    def prebake(self, key, angles, scales, build=None, *args, scale_step=None, bank=None, params=()):
+        """Fill the atlas ahead of time, e.g. for a sprite's whole flap range at scene start.
+
+        With bank (a file name) the sprites are kept in a SpriteBank, so later
+        runs map them instead of rotating them again.  params is whatever the
+        base sprite depends on besides build, e.g. its image's mtime.
+        """
+        if bank is None:
+            for scale in scales:
+                for angle in angles:
+                    self.get(key, angle, scale, build, *args, scale_step=scale_step)
+            return
+
+        base = self.base(key, build, *args)
+
+        def rotate(a, s, step):
+            return pygame.transform.rotozoom(base, a * self.angle_step, s * step)
+
+        slots = sorted({self.quantize(angle, scale, scale_step) for scale in scales for angle in angles})
+        sprites = SpriteBank(bank, slots, rotate, (key, self.angle_step, params, build and fingerprint(build)))
+        with self.lock:
+            for (a, s, step), surf in sprites.items():
+                self.pinned[key, a, s, step] = surf
+
+    def drop(self, key):
+        with self.lock:
+            for slot in [slot for slot in self.pinned if slot[0] == key]:
+                del self.pinned[slot]
+            for slot in [slot for slot in self.baked if slot[0] == key]:
+                self.used -= self.size_of(self.baked.pop(slot))
+
+    def clear(self):
+        with self.lock:
+            self.bases.clear()
+            self.baked.clear()
+            self.pinned.clear()
+            self.used = 0
+
+    @staticmethod
+    def size_of(surf):
+        w, h = surf.get_size()
+        return w * h * surf.get_bytesize()
@@ -0,0 +1,124 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+
+from assets import save_cache_file
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "fractal-visualizer", "sprites")
+
+# Pixel layouts a bank can be wrapped back from without converting
+FORMATS = {
+    (0xff0000, 0xff00, 0xff, 0xff000000): "BGRA",
+    (0xff, 0xff00, 0xff0000, 0xff000000): "RGBA",
+    (0xff00, 0xff0000, 0xff000000, 0xff): "ARGB",
+}
+
+MAGIC = b"FVBANK1\n"
+HEADER = struct.Struct("<I")  # sprite count
+ENTRY = struct.Struct("<QII")  # offset of the pixels, width, height
+
+_writing = threading.Lock()  # scenes are built on the preloader thread too
+
+
+def fingerprint(render):
+    """Name and bytecode of the function that draws a bank's sprites, so editing it renders them afresh."""
+    code = getattr(render, "__code__", None)
+    if code is None:
+        return getattr(render, "__qualname__", repr(render))
+    consts = [c for c in code.co_consts if not hasattr(c, "co_code")]
+    return f"{render.__module__}.{render.__qualname__}:" + hashlib.sha1(code.co_code + repr(consts).encode()).hexdigest()
+
+
+# --- Pre-rendered sprite banks ---
+class SpriteBank:
+    """A fixed set of procedural sprites, rendered once into a file that later runs memory-map.
+
+    keys lists every sprite in the bank and render(*key) draws one.  The file
+    is a table of (offset, width, height) in key order followed by the raw
+    pixels in the display's alpha layout; bank[key] wraps a sprite as a
+    Surface straight over the mapped bytes, so loading copies and decodes
+    nothing and processes using the same bank share its pages.
+
+    The file is named after the keys, params (anything else the sprites
+    depend on, e.g. a source image's mtime), the render function's bytecode
+    and the pixel layout.  When any of them change the bank is rendered
+    again and the old file deleted.  Without a usable cache directory the
+    sprites are simply rendered into memory.
+    """
+
+    def __init__(self, name, keys, render, params=(), cache_dir=CACHE_DIR):
+        self.keys = list(keys)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.render = render
+        self.surfaces = {}
+        self.entries = None
+        layout = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+        self.format = FORMATS.get(layout)
+        recipe = repr((self.keys, params, fingerprint(render), self.format))
+        self.path = os.path.join(cache_dir, f"{name}-{hashlib.sha1(recipe.encode()).hexdigest()[:16]}.bank")
+        if self.format is not None:
+            with _writing:
+                if not self.map():
+                    self.build(name)
+
+    def __getitem__(self, key):
+        surf = self.surfaces.get(key)
+        if surf is None:
+            if self.entries is None:
+                surf = self.render(*key)  # no file: rendered on first use instead
+            else:
+                offset, w, h = self.entries[self.index[key]]
+                surf = pygame.image.frombuffer(self.view[offset:offset + w * h * 4], (w, h), self.format)
+            self.surfaces[key] = surf
+        return surf
+
+    def items(self):
+        return ((key, self[key]) for key in self.keys)
+
+    def map(self):
+        """Map an existing, complete bank file; False if there isn't one."""
+        try:
+            with open(self.path, "rb") as f:
+                view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            count, = HEADER.unpack_from(view, len(MAGIC))
+            table = len(MAGIC) + HEADER.size
+            entries = [ENTRY.unpack_from(view, table + i * ENTRY.size) for i in range(count)]
+        except (OSError, ValueError, struct.error):
+            return False  # missing, or too short to be a bank
+        if bytes(view[:len(MAGIC)]) != MAGIC or count != len(self.keys) or (
+                entries and entries[-1][0] + entries[-1][1] * entries[-1][2] * 4 > len(view)):
+            return False
+        self.view = view
+        self.entries = entries
+        return True
+
+    def build(self, name):
+        """Render every sprite, write the file and map it; stale banks of the same name are deleted."""
+        masks = next(masks for masks, fmt in FORMATS.items() if fmt == self.format)
+        sprites = []
+        for key in self.keys:
+            surf = self.render(*key)
+            if surf.get_masks() != masks:
+                surf = surf.convert_alpha()
+            sprites.append(surf)
+
+        offset = len(MAGIC) + HEADER.size + ENTRY.size * len(sprites)
+        table = []
+        for surf in sprites:
+            w, h = surf.get_size()
+            table.append(ENTRY.pack(offset, w, h))
+            offset += w * h * 4
+
+        def write(f):
+            f.write(MAGIC + HEADER.pack(len(sprites)) + b"".join(table))
+            for surf in sprites:
+                f.write(surf.get_view("0").raw)  # 32-bit rows are never padded
+
+        # Stale banks of the same name go too, unless one is still mapped elsewhere
+        save_cache_file(self.path, name, write)
+        if not self.map():
+            self.surfaces = dict(zip(self.keys, sprites))  # couldn't save it; keep what was rendered
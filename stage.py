@@ -0,0 +1,131 @@
+"""Runtime state shared by the show's entry points and every scene.
+
+init_display() fills in the screen globals; scenes read them as stage.WIDTH
+etc. at draw time, so they follow the current display and render scale.
+"""
+import os
+
+import pygame
+
+from assets import AssetManager
+from audio_analysis import AudioEnvelopes
+from compositor import Compositor
+from petal_textures import PetalTextures
+from profiler import FrameProfiler
+from sprite_atlas import SpriteAtlas
+
+FPS = 60
+SCENE_DURATION = FPS * 10
+FADE_DURATION = FPS * 2
+# Internal render resolution as a fraction of the display's width and height
+RENDER_SCALES = (1.0, 0.75, 2 / 3, 0.5)
+AUTO_RENDER_PIXELS = 1920 * 1080  # --render-scale auto renders at most this many pixels
+
+# Decoded and screen-scaled images, kept across scene cycles and restarts
+assets = AssetManager(budget_mb=256)
+# Rotated petal/butterfly sprites shared by every scene and the PetalField overlay
+sprites = SpriteAtlas(budget_mb=128, angle_step=3.0)
+# The vortex's large glowing petals, coarser and budgeted on their own so they don't evict the rest
+vortex_sprites = SpriteAtlas(budget_mb=64, angle_step=6.0, scale_step=0.4)
+# Gradient petals for the painterly scenes, kept apart so they don't evict the small sprites
+petal_textures = PetalTextures(budget_mb=96)
+# Band energies and onsets of each scene's music, switched on by --audio-reactive
+audio = AudioEnvelopes(FPS)
+# Per-phase frame timing, switched on by --profile / --hud
+profiler = FrameProfiler(budget_ms=1000 / FPS)
+
+# Screen globals, filled in by init_display().  Scenes draw on `screen`, which is
+# WIDTH x HEIGHT at the internal render resolution; present() upscales it to `display`.
+WIDTH, HEIGHT = 0, 0
+CENTER = (0, 0)
+screen = None
+display = None
+compositor = None
+clock = None
+font = None
+hud_font = None
+
+# Animation runs on the simulation clock, advanced in fixed steps by simulate(), so
+# it keeps pace with wall time (and the music) however long frames take to draw.
+# `interpolation` is how far (0-1) the frame being drawn sits past the last step.
+sim_frame = 0
+interpolation = 0.0
+
+
+def pick_render_scale(display_size, render_scale="auto"):
+    """render_scale as a fraction, or for "auto" the largest of RENDER_SCALES within AUTO_RENDER_PIXELS."""
+    if render_scale != "auto":
+        return float(render_scale)
+    w, h = display_size
+    return next((s for s in RENDER_SCALES if w * s * h * s <= AUTO_RENDER_PIXELS), RENDER_SCALES[-1])
+
+
+def init_display(headless=False, size=None, render_scale=1.0):
+    global WIDTH, HEIGHT, CENTER, screen, display, compositor, clock, font, hud_font
+    if headless:
+        # Offscreen rendering: no window, no sound card needed
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    # Screen setup
+    pygame.init()
+    if not headless:
+        pygame.mixer.init()
+        #pygame.mixer.music.load("assets/SalmonLikeTheFish - Zion.mp3")
+        pygame.mixer.music.set_volume(0.5)
+        #pygame.mixer.music.play(-1)
+
+    font = pygame.font.SysFont(None, 60)
+    hud_font = pygame.font.SysFont(None, 26)
+
+    if headless:
+        display = pygame.display.set_mode(size or (1920, 1080))
+        scale = pick_render_scale(display.get_size(), render_scale)
+        WIDTH, HEIGHT = (max(1, round(n * scale)) for n in display.get_size())
+        screen = display if scale == 1 else pygame.Surface((WIDTH, HEIGHT)).convert()
+    else:
+        info = pygame.display.Info()
+        scale = pick_render_scale((info.current_w, info.current_h), render_scale)
+        WIDTH, HEIGHT = max(1, round(info.current_w * scale)), max(1, round(info.current_h * scale))
+        if scale == 1:
+            display = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
+        else:
+            # SDL's renderer stretches the smaller window to the panel when it presents
+            display = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN | pygame.SCALED)
+        screen = display
+    clock = pygame.time.Clock()
+    CENTER = (WIDTH // 2, HEIGHT // 2)
+    compositor = Compositor((WIDTH, HEIGHT))
+
+
+def present(frame=None):
+    """Put frame (default: screen) on the display, upscaling it if it was rendered smaller.
+
+    Live windows are SCALED and upscaled by SDL, so this only scales for headless output.
+    Anything drawn on the display afterwards, like the HUD, is therefore at output
+    resolution headless but at the internal resolution in a live window, where SDL
+    stretches it with the frame.
+    """
+    frame = frame or screen
+    if frame.get_size() != display.get_size():
+        # Nearest-neighbour: smoothscale costs ~4x as much at 4K
+        pygame.transform.scale(frame, display.get_size(), display)
+    elif frame is not display:
+        display.blit(frame, (0, 0))
+
+
+def ticks():
+    """Milliseconds of simulated time since start."""
+    return sim_frame * 1000 // FPS
+
+
+def draw_text(surface, text, alpha, text_font=None, **position):
+    """White text placed by any Rect keyword, e.g. center=(x, y) or topleft=(x, y)."""
+    label = (text_font or font).render(text, True, (255, 255, 255))
+    label.set_alpha(alpha)
+    rect = label.get_rect(**position)
+    surface.blit(label, rect)
+
+
+def draw_scene_title(surface, text, alpha):
+    draw_text(surface, text, alpha, center=(WIDTH // 2, 80))
@@ -0,0 +1,45 @@
+import time
+
+
+# --- Fixed-rate simulation clock ---
+class FixedTimestep:
+    """Says how many fixed simulation steps each rendered frame should run.
+
+    Real time since the last frame is added to an accumulator that is paid out
+    in whole steps of 1/rate seconds, so the show advances at the same speed
+    whether frames take 5 ms or 50 ms: a slow machine runs several updates and
+    draws once, a fast one draws some frames without an update.  What is left
+    over is `alpha`, how far (0-1) the frame sits between the last step and the
+    next, for drawing motion in between.  After a stall longer than max_steps
+    the backlog is dropped rather than replayed.
+    """
+
+    def __init__(self, rate, max_steps=8):
+        self.dt = 1 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last = None
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
+
+    def reset(self):
+        """Start timing afresh, e.g. after a scene change that took a while."""
+        self.accumulator = 0.0
+        self.last = None
+
+    def advance(self, now=None):
+        """Steps to run for a frame drawn at now (seconds, default perf_counter)."""
+        now = time.perf_counter() if now is None else now
+        if self.last is None:
+            self.last = now
+            return 1  # the first frame shows the first step
+        self.accumulator += now - self.last
+        self.last = now
+        steps = int(self.accumulator / self.dt + 1e-9)
+        self.accumulator -= steps * self.dt
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        return steps
@@ -2,6 +2,8 @@ import pygame
 import time
 import os
 
+from assets import AssetManager
+
 # Image files
 images = [
     "cairo_floral_mandala.png",
@@ -18,13 +20,12 @@ clock = pygame.time.Clock()
 FPS = 60
 SCENE_DURATION = FPS * 10  # 10 seconds per image
 
-# Load and scale images
+# Load and scale images (scaled copies are cached on disk per resolution)
+assets = AssetManager()
 loaded_images = []
 for img_name in images:
     if os.path.exists(img_name):
-        img = pygame.image.load(img_name).convert_alpha()
-        scaled = pygame.transform.smoothscale(img, (WIDTH, HEIGHT))
-        loaded_images.append(scaled)
+        loaded_images.append(assets.image(img_name, size=(WIDTH, HEIGHT), alpha=True, smooth=True))
 
 if not loaded_images:
     raise FileNotFoundError("None of the images were found in the current directory.")